@@ -1,7 +1,17 @@
 """Main client for working with Google Sheets."""
 
+import contextlib
+import hashlib
 import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Any
 
 from .core.spreadsheet import Spreadsheet
@@ -20,8 +30,20 @@ class GSParseClient:
 	Provides convenient interface for loading and parsing Google Sheets.
 	"""
 
+	# Maximum number of worksheets downloaded concurrently in CSV mode
+	MAX_DOWNLOAD_WORKERS = 8
+
+	# Number of leading characters of a CSV string used for delimiter detection
+	CSV_SAMPLE_SIZE = 4096
+
 	def __init__(
-		self, timeout: int = 30, max_retries: int = 3, preserve_strings: bool = False
+		self,
+		timeout: int = 30,
+		max_retries: int = 3,
+		preserve_strings: bool = False,
+		cache_ttl: float = 300.0,
+		cache_size: int = 0,
+		cache_dir: str | os.PathLike[str] | None = None,
 	):
 		"""Initialize client.
 
@@ -29,18 +51,41 @@ class GSParseClient:
 			timeout: Request timeout in seconds
 			max_retries: Maximum number of retry attempts
 			preserve_strings: If True, all values will be kept as strings without type conversion
+			cache_ttl: Time in seconds a loaded spreadsheet is reused for the same URL
+			cache_size: Maximum number of cached spreadsheets (0, the default,
+				disables caching). Cached spreadsheets are shared between calls.
+			cache_dir: Directory for persisting parsed XLSX workbooks between runs
+				(if None, parsed workbooks are not stored on disk). Only point it
+				at a directory you trust, since cached files are unpickled.
 		"""
 		self.downloader = GoogleSheetsDownloader(timeout, max_retries)
 		self.csv_parser = CSVParser(preserve_strings=preserve_strings)
 		self.xlsx_parser = XLSXParser(preserve_strings=preserve_strings)
 		self.preserve_strings = preserve_strings
-
-	def load_spreadsheet(self, url: str, format_type: str = 'xlsx') -> Spreadsheet:
+		self._cache_ttl = cache_ttl
+		self._cache_max = cache_size
+		self._cache: OrderedDict[tuple[str, str], tuple[float, Spreadsheet]] = (
+			OrderedDict()
+		)
+		# The cache is shared by all threads using this client
+		self._cache_lock = threading.Lock()
+		self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+		self._parsers: dict[str, CSVParser] = {}
+
+	def load_spreadsheet(
+		self, url: str, format_type: str = 'xlsx', cache: bool = True
+	) -> Spreadsheet:
 		"""Loads and parses Google Sheets table.
 
+		If the client was created with ``cache_size`` > 0, loaded spreadsheets
+		are cached per URL and format for ``cache_ttl`` seconds, so repeated
+		calls don't download and parse the table again. The cached object is
+		shared between calls, so changes made to it are visible to later calls.
+
 		Args:
 			url: Google Sheets table URL
 			format_type: Export format type ("xlsx" or "csv")
+			cache: If False, always download the table and don't cache the result
 
 		Returns:
 			Spreadsheet object
@@ -60,19 +105,125 @@ class GSParseClient:
 				stacklevel=2,
 			)
 
-		if format_type == 'xlsx':
-			# For XLSX, download the entire workbook and parse all sheets
-			try:
-				data = self.downloader.download_sheet(url, 'xlsx')
-				spreadsheet = self.xlsx_parser.parse_workbook(data)
-				spreadsheet.url = url
-				return spreadsheet
-			except Exception as e:
-				# Fallback to CSV if XLSX fails
-				logger.warning(f'XLSX download failed, falling back to CSV: {e}')
-				format_type = 'csv'
+		key = (url, format_type)
+		if cache:
+			cached = self._get_cached(key)
+			if cached is not None:
+				return cached
+
+		spreadsheet = self._fetch_spreadsheet(url, format_type)
+
+		if cache:
+			self._store_cached(key, spreadsheet)
+		return spreadsheet
 
-		# For CSV format (or fallback)
+	def invalidate(self, url: str | None = None) -> None:
+		"""Removes cached spreadsheets.
+
+		Args:
+			url: Google Sheets table URL (if None, clears the whole cache)
+		"""
+		with self._cache_lock:
+			if url is None:
+				self._cache.clear()
+				return
+
+			for key in [key for key in self._cache if key[0] == url]:
+				del self._cache[key]
+
+	def _get_cached(self, key: tuple[str, str]) -> Spreadsheet | None:
+		"""Returns cached spreadsheet if it hasn't expired yet."""
+		with self._cache_lock:
+			entry = self._cache.get(key)
+			if entry is None:
+				return None
+
+			loaded_at, spreadsheet = entry
+			if time.monotonic() - loaded_at > self._cache_ttl:
+				del self._cache[key]
+				return None
+
+			self._cache.move_to_end(key)
+			return spreadsheet
+
+	def _store_cached(self, key: tuple[str, str], spreadsheet: Spreadsheet) -> None:
+		"""Caches spreadsheet, evicting the least recently used entries."""
+		if self._cache_max <= 0:
+			return
+
+		with self._cache_lock:
+			self._cache[key] = (time.monotonic(), spreadsheet)
+			self._cache.move_to_end(key)
+			while len(self._cache) > self._cache_max:
+				self._cache.popitem(last=False)
+
+	def _fetch_spreadsheet(self, url: str, format_type: str) -> Spreadsheet:
+		"""Downloads and parses Google Sheets table without using the cache."""
+		if format_type != 'xlsx':
+			return self._load_csv(url)
+
+		try:
+			return self._load_xlsx(url)
+		except Exception as e:
+			# Fallback to CSV if XLSX fails
+			logger.warning('XLSX download failed, falling back to CSV: %s', e)
+			return self._load_csv(url)
+
+	def _load_xlsx(self, url: str) -> Spreadsheet:
+		"""Downloads the entire workbook as XLSX and parses all sheets."""
+		data = self.downloader.download_sheet(url, 'xlsx')
+		spreadsheet = self._parse_workbook(data)
+		spreadsheet.url = url
+		return spreadsheet
+
+	def _parse_workbook(self, data: bytes) -> Spreadsheet:
+		"""Parses XLSX workbook, reusing the on-disk cache if configured.
+
+		Cache files are keyed on the hash of the downloaded bytes, so a
+		changed spreadsheet never hits a stale entry.
+		"""
+		if self.cache_dir is None:
+			return self.xlsx_parser.parse_workbook(data)
+
+		digest = hashlib.sha256(data).hexdigest()
+		# Backends and modes produce different values, so each gets its own file
+		parser = self.xlsx_parser
+		cache_file = self.cache_dir / (
+			f'{digest}-{parser.backend}-{int(parser.data_only)}'
+			f'-{int(self.preserve_strings)}.pickle'
+		)
+
+		try:
+			with cache_file.open('rb') as f:
+				return pickle.load(f)
+		except FileNotFoundError:
+			pass
+		except Exception as e:
+			logger.warning('Ignoring unreadable cache file %s: %s', cache_file, e)
+
+		spreadsheet = parser.parse_workbook(data)
+
+		tmp_path = None
+		try:
+			self.cache_dir.mkdir(parents=True, exist_ok=True)
+			# Write to a temporary file first so readers never see partial data
+			fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+			with os.fdopen(fd, 'wb') as f:
+				pickle.dump(spreadsheet, f, protocol=pickle.HIGHEST_PROTOCOL)
+			os.replace(tmp_path, cache_file)
+			tmp_path = None
+		except Exception as e:
+			# Caching is best effort, the parsed workbook is still returned
+			logger.warning('Failed to write cache file %s: %s', cache_file, e)
+		finally:
+			if tmp_path is not None:
+				with contextlib.suppress(OSError):
+					os.unlink(tmp_path)
+
+		return spreadsheet
+
+	def _load_csv(self, url: str) -> Spreadsheet:
+		"""Downloads every worksheet as CSV and parses them."""
 		worksheets_info = self.downloader.list_worksheets(url)
 
 		if not worksheets_info:
@@ -81,16 +232,18 @@ class GSParseClient:
 			worksheet = self.csv_parser.parse(data, 'Sheet1')
 			return Spreadsheet(title='Imported Sheet', worksheets=[worksheet], url=url)
 
-		# Load all worksheets
+		# Load all worksheets, keeping the original worksheet order
+		downloads = self._download_worksheets(url, worksheets_info)
 		worksheets = []
-		for sheet_name, gid in worksheets_info.items():
+		for sheet_name in worksheets_info:
+			if sheet_name not in downloads:
+				continue
 			try:
-				data = self.downloader.download_sheet(url, 'csv', gid)
-				worksheet = self.csv_parser.parse(data, sheet_name)
+				worksheet = self.csv_parser.parse(downloads[sheet_name], sheet_name)
 				worksheets.append(worksheet)
 			except Exception as e:
-				# If unable to load worksheet, skip it
-				print(f"Warning: failed to load worksheet '{sheet_name}': {e}")
+				# If unable to parse worksheet, skip it
+				logger.warning("Failed to load worksheet '%s': %s", sheet_name, e)
 				continue
 
 		if not worksheets:
@@ -98,6 +251,37 @@ class GSParseClient:
 
 		return Spreadsheet(title=worksheets[0].name, worksheets=worksheets, url=url)
 
+	def _download_worksheets(
+		self, url: str, worksheets_info: dict[str, str]
+	) -> dict[str, bytes]:
+		"""Downloads worksheets as CSV concurrently.
+
+		Downloads are I/O bound, so they run in a thread pool while parsing
+		stays in the calling thread.
+
+		Args:
+			url: Google Sheets table URL
+			worksheets_info: Dictionary {worksheet_name: gid}
+
+		Returns:
+			Dictionary {worksheet_name: data} of successfully downloaded worksheets
+		"""
+		downloads = {}
+		max_workers = min(self.MAX_DOWNLOAD_WORKERS, len(worksheets_info))
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			futures = {
+				executor.submit(self.downloader.download_sheet, url, 'csv', gid): name
+				for name, gid in worksheets_info.items()
+			}
+			for future in as_completed(futures):
+				sheet_name = futures[future]
+				try:
+					downloads[sheet_name] = future.result()
+				except Exception as e:
+					# If unable to download worksheet, skip it
+					logger.warning("Failed to load worksheet '%s': %s", sheet_name, e)
+		return downloads
+
 	def load_worksheet(
 		self, url: str, worksheet_name: str | None = None, format_type: str = 'xlsx'
 	) -> Worksheet:
@@ -138,16 +322,45 @@ class GSParseClient:
 		"""
 		# Detect delimiter automatically
 		detected_delimiter = self.csv_parser.detect_delimiter(
-			csv_string.encode('utf-8')
+			self._csv_sample(csv_string).encode('utf-8')
 		)
 
-		# Create parser with detected delimiter
-		parser = CSVParser(
-			delimiter=detected_delimiter, preserve_strings=self.preserve_strings
-		)
+		# Reuse parser for detected delimiter
+		parser = self._parsers.get(detected_delimiter)
+		if parser is None:
+			parser = CSVParser(
+				delimiter=detected_delimiter, preserve_strings=self.preserve_strings
+			)
+			self._parsers[detected_delimiter] = parser
 
 		return parser.parse_from_string(csv_string, worksheet_name)
 
+	@staticmethod
+	def _csv_sample(csv_string: str) -> str:
+		"""Returns leading lines of CSV string used for delimiter detection.
+
+		Args:
+			csv_string: CSV string
+
+		Returns:
+			Part of the string the delimiter detection looks at
+		"""
+		# Delimiter detection only looks at the first lines, so the whole
+		# string does not need to be encoded
+		sample = csv_string[: GSParseClient.CSV_SAMPLE_SIZE]
+		if sample.count('\n') >= CSVParser.DETECT_LINES or len(sample) == len(
+			csv_string
+		):
+			return sample
+
+		# Leading lines are longer than the sample, cut after the last one
+		end = -1
+		for _ in range(CSVParser.DETECT_LINES):
+			end = csv_string.find('\n', end + 1)
+			if end == -1:
+				return csv_string
+		return csv_string[:end]
+
 	def get_sheet_info(self, url: str) -> dict[str, Any]:
 		"""Gets information about the table.
 
@@ -1,13 +1,57 @@
 """Cell class for representing a cell in Google Sheets."""
 
 import logging
+import operator
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Largest column number supported by Excel (XFD)
+MAX_COLUMN = 16384
 
-@dataclass
+
+def _compute_column_letter(col_num: int) -> str:
+	"""Converts column number to letter notation using base-26 arithmetic."""
+	# Collect letter codes in reverse order and decode once at the end
+	buf = bytearray()
+	while col_num > 0:
+		col_num -= 1
+		buf.append(65 + col_num % 26)
+		col_num //= 26
+	buf.reverse()
+	return buf.decode('ascii')
+
+
+# Precomputed column letters, indexed by column number (index 0 is unused)
+_COL_LETTERS = tuple(_compute_column_letter(i) for i in range(MAX_COLUMN + 1))
+
+# Reverse lookup of _COL_LETTERS: column number by column letters
+_COL_NUMBERS = {letters: i for i, letters in enumerate(_COL_LETTERS) if letters}
+
+
+def _number_to_column_letter(col_num: int) -> str:
+	"""Converts column number to letter notation (A, B, C, ...)."""
+	if type(col_num) is int and 0 <= col_num <= MAX_COLUMN:
+		return _COL_LETTERS[col_num]
+	return _compute_column_letter(col_num)
+
+
+def _column_letter_to_number(col_letters: str) -> int:
+	"""Converts column letter notation (A, B, ..., AA) to column number."""
+	col_num = _COL_NUMBERS.get(col_letters)
+	if col_num is not None:
+		return col_num
+
+	col_num = 0
+	# Iterating bytes yields character codes directly, without ord() calls
+	for code in col_letters.encode('ascii'):
+		col_num = col_num * 26 + code - 64
+	return col_num
+
+
+@dataclass(slots=True)
 class Cell:
 	"""Represents a cell in Google Sheets.
 
@@ -28,31 +72,64 @@ class Cell:
 	def __post_init__(self) -> None:
 		"""Validate data after initialization."""
 		if self.row < 1:
-			logger.error(f'Invalid row number: {self.row}. Must be greater than 0')
+			logger.error('Invalid row number: %s. Must be greater than 0', self.row)
 			raise ValueError('Row number must be greater than 0')
 		if self.column < 1:
 			logger.error(
-				f'Invalid column number: {self.column}. Must be greater than 0'
+				'Invalid column number: %s. Must be greater than 0', self.column
 			)
 			raise ValueError('Column number must be greater than 0')
+		if type(self.column) is not int:
+			# Raises TypeError for columns that can't be converted to letters
+			operator.index(self.column)
+
+		# Skip computing the address unless debug logging is enabled
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug('Created cell %s with value: %r', self.address, self.value)
+
+	@classmethod
+	def bulk_create(
+		cls, rows: Iterable[int], columns: Iterable[int], values: Iterable[Any]
+	) -> list['Cell']:
+		"""Creates cells from parallel sequences of coordinates and values.
+
+		Skips the validation done in ``__post_init__``, so callers must pass
+		coordinates that are already known to be valid (starting from 1).
+
+		Args:
+			rows: Row numbers of the cells
+			columns: Column numbers of the cells
+			values: Cell values
 
-		logger.debug(f'Created cell {self.address} with value: {self.value}')
+		Returns:
+			List of cells
+		"""
+		new = object.__new__
+		cells = []
+		append = cells.append
+		for row, column, value in zip(rows, columns, values, strict=False):
+			cell = new(cls)
+			cell.row = row
+			cell.column = column
+			cell.value = value
+			cell.formatted_value = None
+			cell.formula = None
+			append(cell)
+		return cells
 
 	@property
 	def address(self) -> str:
 		"""Returns cell address in A1 format."""
-		return self._number_to_column_letter(self.column) + str(self.row)
+		return _number_to_column_letter(self.column) + str(self.row)
 
 	@property
 	def is_empty(self) -> bool:
 		"""Checks if the cell is empty."""
-		return self.value is None or str(self.value).strip() == ''
-
-	def _number_to_column_letter(self, col_num: int) -> str:
-		"""Converts column number to letter notation (A, B, C, ...)."""
-		result = ''
-		while col_num > 0:
-			col_num -= 1
-			result = chr(65 + col_num % 26) + result
-			col_num //= 26
-		return result
+		value = self.value
+		if value is None:
+			return True
+		if isinstance(value, str):
+			# isspace() checks in place instead of building a stripped copy
+			return not value or value.isspace()
+		# Non-string values (numbers, booleans, ...) are never blank
+		return False
@@ -1,15 +1,22 @@
 """Range class for representing a range of cells in Google Sheets."""
 
 import logging
+import operator
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from .cell import Cell
+from .cell import Cell, _column_letter_to_number, _number_to_column_letter
 
 logger = logging.getLogger(__name__)
 
+# Cell address in A1 notation: column letters followed by row number
+_ADDR_RE = re.compile(r'([A-Z]+)(\d+)')
 
-@dataclass
+
+@dataclass(slots=True)
 class Range:
 	"""Represents a range of cells in Google Sheets.
 
@@ -29,40 +36,68 @@ class Range:
 
 	def __post_init__(self) -> None:
 		"""Validate data after initialization."""
+		# Valid ranges pass with one chained comparison per axis, the
+		# individual checks only run to report what is wrong
+		try:
+			valid = (
+				1 <= self.start_row <= self.end_row
+				and 1 <= self.start_column <= self.end_column
+			)
+		except TypeError:
+			valid = False
+		if not valid:
+			self._check_bounds()
+		if type(self.start_column) is not int or type(self.end_column) is not int:
+			# Raises TypeError for columns that can't be converted to letters
+			operator.index(self.start_column)
+			operator.index(self.end_column)
+
+		# Skip computing the address unless debug logging is enabled
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug('Created range: %s', self.address)
+
+	def _check_bounds(self) -> None:
+		"""Raises an error describing the invalid range bounds, if any."""
 		if self.start_row < 1 or self.end_row < 1:
 			logger.error(
-				f'Invalid row numbers: start={self.start_row}, end={self.end_row}'
+				'Invalid row numbers: start=%s, end=%s', self.start_row, self.end_row
 			)
 			raise ValueError('Row numbers must be greater than 0')
 		if self.start_column < 1 or self.end_column < 1:
 			logger.error(
-				f'Invalid column numbers: start={self.start_column}, end={self.end_column}'
+				'Invalid column numbers: start=%s, end=%s',
+				self.start_column,
+				self.end_column,
 			)
 			raise ValueError('Column numbers must be greater than 0')
 		if self.start_row > self.end_row:
 			logger.error(
-				f'Start row ({self.start_row}) cannot be greater than end row ({self.end_row})'
+				'Start row (%s) cannot be greater than end row (%s)',
+				self.start_row,
+				self.end_row,
 			)
 			raise ValueError('Start row cannot be greater than end row')
 		if self.start_column > self.end_column:
 			logger.error(
-				f'Start column ({self.start_column}) cannot be greater than end column ({self.end_column})'
+				'Start column (%s) cannot be greater than end column (%s)',
+				self.start_column,
+				self.end_column,
 			)
 			raise ValueError('Start column cannot be greater than end column')
 
-		logger.debug(f'Created range: {self.address}')
-
 	@property
 	def address(self) -> str:
 		"""Returns range address in A1:B2 format."""
-		start_cell = self._number_to_column_letter(self.start_column) + str(
-			self.start_row
+		# Format the whole address at once instead of concatenating parts
+		cells = (
+			f'{_number_to_column_letter(self.start_column)}{self.start_row}'
+			f':{_number_to_column_letter(self.end_column)}{self.end_row}'
 		)
-		end_cell = self._number_to_column_letter(self.end_column) + str(self.end_row)
 
-		if self.worksheet_name:
-			return f'{self.worksheet_name}!{start_cell}:{end_cell}'
-		return f'{start_cell}:{end_cell}'
+		worksheet_name = self.worksheet_name
+		if worksheet_name:
+			return f'{worksheet_name}!{cells}'
+		return cells
 
 	@property
 	def row_count(self) -> int:
@@ -86,38 +121,52 @@ class Range:
 			and self.start_column <= column <= self.end_column
 		)
 
+	def contains_many(self, rows: Iterable[int], columns: Iterable[int]) -> list[bool]:
+		"""Checks which of the specified cells the range contains.
+
+		Args:
+			rows: Row numbers of the cells
+			columns: Column numbers of the cells
+
+		Returns:
+			List of flags, one per (row, column) pair
+		"""
+		start_row, end_row = self.start_row, self.end_row
+		start_column, end_column = self.start_column, self.end_column
+		return [
+			start_row <= row <= end_row and start_column <= column <= end_column
+			for row, column in zip(rows, columns, strict=False)
+		]
+
 	def get_cells(self, data: list[list[Any]]) -> list[Cell]:
 		"""Returns list of cells from data in the specified range."""
-		cells = []
-		logger.debug(f'Extracting cells from range {self.address}')
-
-		for row_idx, row_data in enumerate(data[self.start_row - 1 : self.end_row]):
-			for col_idx, value in enumerate(
-				row_data[self.start_column - 1 : self.end_column]
-			):
-				cell = Cell(
-					row=self.start_row + row_idx,
-					column=self.start_column + col_idx,
-					value=value,
-				)
-				cells.append(cell)
-
-		logger.debug(f'Extracted {len(cells)} cells from range')
+		if logger.isEnabledFor(logging.DEBUG):
+			logger.debug('Extracting cells from range %s', self.address)
+
+		# Collect coordinates and values once; the range is already validated,
+		# so cells can be created without per-cell checks.
+		col_start = self.start_column - 1
+		rows: list[int] = []
+		columns: list[int] = []
+		values: list[Any] = []
+		for row_number, row_data in enumerate(
+			data[self.start_row - 1 : self.end_row], self.start_row
+		):
+			row_values = row_data[col_start : self.end_column]
+			count = len(row_values)
+			rows.extend([row_number] * count)
+			columns.extend(range(self.start_column, self.start_column + count))
+			values.extend(row_values)
+
+		cells = Cell.bulk_create(rows, columns, values)
+
+		logger.debug('Extracted %d cells from range', len(cells))
 		return cells
 
-	def _number_to_column_letter(self, col_num: int) -> str:
-		"""Converts column number to letter notation (A, B, C, ...)."""
-		result = ''
-		while col_num > 0:
-			col_num -= 1
-			result = chr(65 + col_num % 26) + result
-			col_num //= 26
-		return result
-
 	@classmethod
 	def from_address(cls, address: str) -> 'Range':
 		"""Creates Range from string address (e.g., "A1:B2" or "Sheet1!A1:B2")."""
-		logger.debug(f'Parsing range address: {address}')
+		logger.debug('Parsing range address: %s', address)
 
 		# Split worksheet name and range
 		if '!' in address:
@@ -135,7 +184,7 @@ class Range:
 		start_row, start_col = cls._parse_cell_address(start_cell)
 		end_row, end_col = cls._parse_cell_address(end_cell)
 
-		logger.debug(f'Parsed range: {start_cell} to {end_cell}')
+		logger.debug('Parsed range: %s to %s', start_cell, end_cell)
 		return cls(
 			start_row=start_row,
 			end_row=end_row,
@@ -145,21 +194,22 @@ class Range:
 		)
 
 	@staticmethod
+	@lru_cache(maxsize=1024)
 	def _parse_cell_address(cell_address: str) -> tuple[int, int]:
-		"""Parses cell address (e.g., "A1") into (row, column)."""
-		import re
+		"""Parses cell address (e.g., "A1") into (row, column).
 
-		match = re.match(r'([A-Z]+)(\d+)', cell_address.upper())
+		Results are memoized, since the same addresses are usually parsed many
+		times. Invalid addresses raise on every call.
+		"""
+		normalized = cell_address if cell_address.isupper() else cell_address.upper()
+
+		match = _ADDR_RE.match(normalized)
 		if not match:
-			logger.error(f'Invalid cell address format: {cell_address}')
+			logger.error('Invalid cell address format: %s', cell_address)
 			raise ValueError(f'Invalid cell address format: {cell_address}')
 
 		col_letters = match.group(1)
 		row_num = int(match.group(2))
 
 		# Convert column letters to number
-		col_num = 0
-		for char in col_letters:
-			col_num = col_num * 26 + (ord(char) - ord('A') + 1)
-
-		return row_num, col_num
+		return row_num, _column_letter_to_number(col_letters)
@@ -1,16 +1,18 @@
 """Spreadsheet class for representing a Google Sheets table with multiple worksheets."""
 
 import logging
+import re
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from .cell import Cell
 from .worksheet import Worksheet
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Spreadsheet:
 	"""Represents a Google Sheets table with multiple worksheets.
 
@@ -23,18 +25,25 @@ class Spreadsheet:
 	title: str
 	worksheets: list[Worksheet]
 	url: str | None = None
+	_name_index: dict[str, int] = field(
+		init=False, repr=False, compare=False, default_factory=dict
+	)
 
 	def __post_init__(self) -> None:
 		"""Validate data after initialization."""
-		if not self.title.strip():
+		if not self.title or self.title.isspace():
 			logger.error('Empty spreadsheet title')
 			raise ValueError('Spreadsheet title cannot be empty')
 		if not self.worksheets:
 			logger.error('No worksheets provided')
 			raise ValueError('Spreadsheet must contain at least one worksheet')
 
+		self._rebuild_name_index()
+
 		logger.debug(
-			f"Created spreadsheet '{self.title}' with {len(self.worksheets)} worksheets"
+			"Created spreadsheet '%s' with %d worksheets",
+			self.title,
+			len(self.worksheets),
 		)
 
 	@property
@@ -56,10 +65,8 @@ class Spreadsheet:
 		Returns:
 			Worksheet or None if not found
 		"""
-		for worksheet in self.worksheets:
-			if worksheet.name == name:
-				return worksheet
-		return None
+		index = self._find_index(name)
+		return self.worksheets[index] if index is not None else None
 
 	def get_worksheet_by_index(self, index: int) -> Worksheet | None:
 		"""Gets worksheet by index.
@@ -89,10 +96,11 @@ class Spreadsheet:
 			worksheet: Worksheet to add
 		"""
 		# Check that a sheet with this name doesn't already exist
-		if self.get_worksheet(worksheet.name):
+		if self._find_index(worksheet.name) is not None:
 			raise ValueError(f"Worksheet with name '{worksheet.name}' already exists")
 
 		self.worksheets.append(worksheet)
+		self._name_index[worksheet.name] = len(self.worksheets) - 1
 
 	def remove_worksheet(self, name: str) -> bool:
 		"""Removes worksheet by name.
@@ -103,18 +111,23 @@ class Spreadsheet:
 		Returns:
 			True if worksheet was removed, False if not found
 		"""
-		for i, worksheet in enumerate(self.worksheets):
-			if worksheet.name == name:
-				del self.worksheets[i]
-				return True
-		return False
+		index = self._find_index(name)
+		if index is None:
+			return False
+
+		del self.worksheets[index]
+		# Removal is rare, so simply reindex the remaining worksheets
+		self._rebuild_name_index()
+		return True
+
+	def iter_all_cells(self) -> Iterator[Cell]:
+		"""Iterates over all cells from all worksheets without building a list."""
+		for worksheet in self.worksheets:
+			yield from worksheet.iter_cells()
 
 	def get_all_cells(self) -> list[Any]:
 		"""Returns all cells from all worksheets."""
-		all_cells = []
-		for worksheet in self.worksheets:
-			all_cells.extend(worksheet.get_all_cells())
-		return all_cells
+		return list(self.iter_all_cells())
 
 	def get_data_summary(self) -> dict[str, Any]:
 		"""Returns spreadsheet data summary.
@@ -122,11 +135,11 @@ class Spreadsheet:
 		Returns:
 			Dictionary with spreadsheet information
 		"""
-		total_cells = sum(ws.row_count * ws.column_count for ws in self.worksheets)
-		non_empty_cells = sum(
-			len([cell for cell in ws.get_all_cells() if not cell.is_empty])
-			for ws in self.worksheets
-		)
+		total_cells = 0
+		non_empty_cells = 0
+		for ws in self.worksheets:
+			total_cells += ws.row_count * ws.column_count
+			non_empty_cells += sum(1 for cell in ws.iter_cells() if not cell.is_empty)
 
 		return {
 			'title': self.title,
@@ -137,19 +150,25 @@ class Spreadsheet:
 			'url': self.url,
 		}
 
+	def iter_cells_by_value(self, value: Any) -> Iterator[Cell]:
+		"""Iterates over cells with the specified value in all worksheets."""
+		for worksheet in self.worksheets:
+			yield from worksheet.iter_cells_by_value(value)
+
 	def find_cells_by_value(self, value: Any) -> list[Any]:
 		"""Finds all cells with the specified value in all worksheets."""
-		cells = []
+		return list(self.iter_cells_by_value(value))
+
+	def iter_cells_by_pattern(self, pattern: str) -> Iterator[Cell]:
+		"""Iterates over cells whose values match the regular expression."""
+		# Compile once for all worksheets
+		compiled_pattern = re.compile(pattern)
 		for worksheet in self.worksheets:
-			cells.extend(worksheet.find_cells_by_value(value))
-		return cells
+			yield from worksheet.iter_cells_by_compiled_pattern(compiled_pattern)
 
 	def find_cells_by_pattern(self, pattern: str) -> list[Any]:
 		"""Finds all cells whose values match the regular expression."""
-		cells = []
-		for worksheet in self.worksheets:
-			cells.extend(worksheet.find_cells_by_pattern(pattern))
-		return cells
+		return list(self.iter_cells_by_pattern(pattern))
 
 	def export_to_dict(self, headers_row: int = 1) -> dict[str, list[dict[str, Any]]]:
 		"""Exports all worksheets to dictionary.
@@ -178,4 +197,32 @@ class Spreadsheet:
 
 	def __contains__(self, name: str) -> bool:
 		"""Checks if worksheet with specified name exists."""
-		return self.get_worksheet(name) is not None
+		return self._find_index(name) is not None
+
+	def _find_index(self, name: str) -> int | None:
+		"""Finds index of the first worksheet with the specified name."""
+		index = self._name_index.get(name)
+		worksheets = self.worksheets
+		if (
+			index is not None
+			and index < len(worksheets)
+			and worksheets[index].name == name
+		):
+			return index
+
+		# The worksheets list or a worksheet name may have been changed
+		# directly, so scan the list and only resync if the name is found
+		for i, worksheet in enumerate(worksheets):
+			if worksheet.name == name:
+				self._rebuild_name_index()
+				return i
+
+		return None
+
+	def _rebuild_name_index(self) -> None:
+		"""Rebuilds the worksheet name to index mapping."""
+		name_index: dict[str, int] = {}
+		for i, worksheet in enumerate(self.worksheets):
+			# Keep the first worksheet for duplicate names
+			name_index.setdefault(worksheet.name, i)
+		self._name_index = name_index
@@ -1,8 +1,12 @@
 """Worksheet class for representing a sheet in Google Sheets."""
 
 import logging
+import re
 from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import partial
+from itertools import compress, islice, repeat, zip_longest
+from operator import is_not, itemgetter
 from typing import Any
 
 from .cell import Cell
@@ -10,8 +14,102 @@ from .range import Range
 
 logger = logging.getLogger(__name__)
 
+# Predicate implemented in C, used with filter() to skip None values
+_is_not_none = partial(is_not, None)
 
-@dataclass
+# Separator placed between values when a row is searched as one string
+_ROW_SEPARATOR = '\x1f'
+
+# Pattern syntax whose result depends on text around the match (\z is the
+# Python 3.14 alias of \Z)
+_CONTEXT_SYNTAX_RE = re.compile(r'[\^$]|\\[AZzbB]|\(\?<?[=!]')
+
+
+def _has_value(value: Any) -> bool:
+	"""Checks if a cell value is neither None nor a blank string."""
+	# Only strings can be blank, so other values are not converted with str()
+	if not isinstance(value, str):
+		return value is not None
+	# isspace() checks in place instead of building a stripped copy
+	return bool(value) and not value.isspace()
+
+
+def _is_context_free(pattern: re.Pattern[str]) -> bool:
+	"""Checks if pattern has no anchors, word boundaries or lookarounds."""
+	return _CONTEXT_SYNTAX_RE.search(pattern.pattern) is None
+
+
+def _row_has_value(row: list[Any]) -> bool:
+	"""Checks if a row contains at least one non-empty value."""
+	# None values are skipped by filter in C, which makes empty rows cheap
+	for value in filter(_is_not_none, row):
+		if not isinstance(value, str) or (value and not value.isspace()):
+			return True
+	return False
+
+
+def _non_empty_column_mask(rows: list[list[Any]], column_count: int) -> list[bool]:
+	"""Flags columns that contain at least one non-empty value.
+
+	Columns beyond column_count are always kept, so the mask covers
+	the longest row.
+
+	Args:
+		rows: Rows to check
+		column_count: Number of columns to check
+
+	Returns:
+		Flag per column
+	"""
+	longest = max(map(len, rows), default=0)
+	checked = min(column_count, longest)
+	mask = [False] * checked + [True] * (longest - checked)
+
+	# Only columns without a value so far are checked in later rows, so
+	# the scan stops as soon as every column is known to be non-empty
+	pending = range(checked)
+	for row in rows:
+		row_length = len(row)
+		still_empty = []
+		for col_idx in pending:
+			if col_idx < row_length and _has_value(row[col_idx]):
+				mask[col_idx] = True
+			else:
+				still_empty.append(col_idx)
+		if not still_empty:
+			break
+		pending = still_empty
+	return mask
+
+
+def _select_columns(rows: list[list[Any]], mask: list[bool]) -> list[list[Any]]:
+	"""Returns copies of rows holding only the columns flagged in mask.
+
+	Args:
+		rows: Rows to copy
+		mask: Flag per column, at least as long as the longest row
+
+	Returns:
+		New rows
+	"""
+	keep = [col_idx for col_idx, flag in enumerate(mask) if flag]
+	if not keep:
+		return [[] for _ in rows]
+
+	start, stop = keep[0], keep[-1] + 1
+	if stop - start == len(keep):
+		# Kept columns are contiguous, e.g. only trailing columns are empty
+		return [row[start:stop] for row in rows]
+
+	# itemgetter picks all kept values in C, short rows fall back to compress
+	getter = itemgetter(*keep)
+	return [
+		list(getter(row)) if len(row) >= stop else list(compress(row, mask))
+		for row in rows
+	]
+
+
+@dataclass(slots=True)
 class Worksheet:
 	"""Represents a worksheet in Google Sheets.
 
@@ -29,17 +127,22 @@ class Worksheet:
 
 	def __post_init__(self) -> None:
 		"""Validate data after initialization."""
-		if not self.name.strip():
+		if not self.name or self.name.isspace():
 			logger.error('Empty worksheet name')
 			raise ValueError('Worksheet name cannot be empty')
 		if self.row_count < 0 or self.column_count < 0:
 			logger.error(
-				f'Invalid dimensions: rows={self.row_count}, columns={self.column_count}'
+				'Invalid dimensions: rows=%s, columns=%s',
+				self.row_count,
+				self.column_count,
 			)
 			raise ValueError('Row and column counts must be non-negative')
 
 		logger.debug(
-			f"Created worksheet '{self.name}' with {self.row_count}x{self.column_count} dimensions"
+			"Created worksheet '%s' with %sx%s dimensions",
+			self.name,
+			self.row_count,
+			self.column_count,
 		)
 
 	def get_cell(self, row: int, column: int) -> Cell | None:
@@ -52,7 +155,8 @@ class Worksheet:
 		Returns:
 			Cell or None if cell doesn't exist
 		"""
-		if not self._is_valid_coordinates(row, column):
+		# Same check as _is_valid_coordinates, inlined for this scalar hot path
+		if not (1 <= row <= self.row_count and 1 <= column <= self.column_count):
 			return None
 
 		value = self.data[row - 1][column - 1] if self.data else None
@@ -93,51 +197,107 @@ class Worksheet:
 		range_obj.worksheet_name = self.name
 		return range_obj
 
-	def get_all_cells(self) -> list[Cell]:
-		"""Returns all cells in the worksheet."""
-		cells = []
+	def iter_cells(self) -> Iterator[Cell]:
+		"""Iterates over all cells in the worksheet without building a list."""
 		for row_idx, row_data in enumerate(self.data):
 			for col_idx, value in enumerate(row_data):
-				cell = Cell(row=row_idx + 1, column=col_idx + 1, value=value)
-				cells.append(cell)
-		return cells
+				yield Cell(row=row_idx + 1, column=col_idx + 1, value=value)
+
+	def get_all_cells(self) -> list[Cell]:
+		"""Returns all cells in the worksheet."""
+		rows: list[int] = []
+		columns: list[int] = []
+		values: list[Any] = []
+		for row_number, row_data in enumerate(self.data, 1):
+			count = len(row_data)
+			rows.extend(repeat(row_number, count))
+			columns.extend(range(1, count + 1))
+			values.extend(row_data)
+
+		return Cell.bulk_create(rows, columns, values)
 
 	def get_cells_in_range(self, range_obj: Range) -> list[Cell]:
 		"""Gets cells in the specified range."""
 		if range_obj.worksheet_name and range_obj.worksheet_name != self.name:
 			return []
 
-		cells = []
-		for row in range(range_obj.start_row, range_obj.end_row + 1):
-			for col in range(range_obj.start_column, range_obj.end_column + 1):
-				cell = self.get_cell(row, col)
-				if cell:
-					cells.append(cell)
-		return cells
+		# Clip the range to the worksheet once instead of checking every cell
+		first_row = max(range_obj.start_row, 1)
+		last_row = min(range_obj.end_row, self.row_count)
+		first_column = max(range_obj.start_column, 1)
+		last_column = min(range_obj.end_column, self.column_count)
+		column_numbers = range(first_column, last_column + 1)
+
+		rows: list[int] = []
+		columns: list[int] = []
+		values: list[Any] = []
+		for row_number in range(first_row, last_row + 1):
+			row_values = self._row_values(row_number)[first_column - 1 : last_column]
+			rows.extend(repeat(row_number, len(row_values)))
+			columns.extend(column_numbers[: len(row_values)])
+			values.extend(row_values)
+
+		return Cell.bulk_create(rows, columns, values)
 
 	def get_row(self, row_number: int) -> list[Cell]:
 		"""Gets all cells in the specified row."""
 		if not self._is_valid_row(row_number):
 			return []
 
-		cells = []
-		for col in range(1, self.column_count + 1):
-			cell = self.get_cell(row_number, col)
-			if cell:
-				cells.append(cell)
-		return cells
+		values = self._row_values(row_number)
+		return Cell.bulk_create(repeat(row_number), range(1, len(values) + 1), values)
 
 	def get_column(self, column_number: int) -> list[Cell]:
 		"""Gets all cells in the specified column."""
 		if not self._is_valid_column(column_number):
 			return []
 
-		cells = []
-		for row in range(1, self.row_count + 1):
-			cell = self.get_cell(row, column_number)
-			if cell:
-				cells.append(cell)
-		return cells
+		if self.data:
+			col_idx = column_number - 1
+			values = [row[col_idx] for row in self.data[: self.row_count]]
+		else:
+			values = [None] * self.row_count
+		return Cell.bulk_create(
+			range(1, len(values) + 1), repeat(column_number), values
+		)
+
+	def iter_row(self, row_number: int) -> Iterator[Cell]:
+		"""Iterates over cells in the specified row without building a list."""
+		if not self._is_valid_row(row_number):
+			return
+
+		for col_idx, value in enumerate(self._row_values(row_number), 1):
+			yield Cell(row=row_number, column=col_idx, value=value)
+
+	def iter_column(self, column_number: int) -> Iterator[Cell]:
+		"""Iterates over cells in the specified column without building a list."""
+		if not self._is_valid_column(column_number):
+			return
+
+		if not self.data:
+			for row_idx in range(1, self.row_count + 1):
+				yield Cell(row=row_idx, column=column_number, value=None)
+			return
+
+		col_idx = column_number - 1
+		for row_idx, row_data in enumerate(islice(self.data, self.row_count), 1):
+			yield Cell(row=row_idx, column=column_number, value=row_data[col_idx])
+
+	def iter_columns(self) -> Iterator[tuple[Any, ...]]:
+		"""Iterates over column values without building the transposed data.
+
+		Yields:
+			Tuple of values for each column, short rows padded with None
+		"""
+		if not self.data or not self.column_count:
+			return
+
+		# zip_longest transposes the rows in C, padding short rows with None
+		transposed = islice(zip_longest(*self.data), self.column_count)
+		yield from transposed
+		empty = (None,) * len(self.data)
+		for _ in range(self.column_count - max(map(len, self.data))):
+			yield empty
 
 	def get_columns(self) -> list[list[Any]]:
 		"""Gets all columns as a list of lists.
@@ -145,20 +305,7 @@ class Worksheet:
 		Returns:
 			List where each element is a column (list of values)
 		"""
-		if not self.data or not self.column_count:
-			return []
-
-		columns = []
-		for col_idx in range(self.column_count):
-			column = []
-			for row in self.data:
-				if col_idx < len(row):
-					column.append(row[col_idx])
-				else:
-					column.append(None)
-			columns.append(column)
-
-		return columns
+		return list(map(list, self.iter_columns()))
 
 	def get_rows(self) -> list[list[Any]]:
 		"""Gets all rows as a list of lists.
@@ -181,54 +328,90 @@ class Worksheet:
 		Returns:
 			List of dictionaries where keys are column headers
 		"""
-		if not self.data or headers_row > self.row_count:
+		if not self.data or not self._is_valid_row(headers_row):
 			return []
 
 		# Get headers, keeping each one bound to its column index so that
 		# values stay aligned even when some header cells are empty.
-		header_cells = self.get_row(headers_row)
-		headers = [
-			(idx, cell.value)
-			for idx, cell in enumerate(header_cells)
-			if cell and not cell.is_empty
-		]
+		header_values = self._row_values(headers_row)
+		columns = [idx for idx, value in enumerate(header_values) if _has_value(value)]
 
-		if not headers:
+		if not columns:
 			return []
 
-		# Get data
-		result = []
-		for row_num in range(headers_row + 1, self.row_count + 1):
-			row_cells = self.get_row(row_num)
-			row_data = {}
-
-			for col_idx, header in headers:
-				cell = row_cells[col_idx] if col_idx < len(row_cells) else None
-				row_data[header] = cell.value if cell else None
-
-			result.append(row_data)
-
-		return result
+		headers = [header_values[idx] for idx in columns]
+		rows = self.data[headers_row : self.row_count]
+		stop = columns[-1] + 1
+
+		# Build dictionaries with zip, so values are never read one by one in
+		# Python; short rows are padded with None
+		if stop == len(columns):
+			# Headers fill the leading columns without gaps
+			return [
+				dict(zip(headers, row, strict=False))
+				if len(row) >= stop
+				else dict(zip_longest(headers, row))
+				for row in rows
+			]
+
+		return [
+			dict(zip(headers, map(row.__getitem__, columns), strict=True))
+			if len(row) >= stop
+			else dict(
+				zip(
+					headers,
+					[row[idx] if idx < len(row) else None for idx in columns],
+					strict=True,
+				)
+			)
+			for row in rows
+		]
 
 	def find_cells_by_value(self, value: Any) -> list[Cell]:
 		"""Finds all cells with the specified value."""
-		cells = []
-		for cell in self.get_all_cells():
-			if cell.value == value:
-				cells.append(cell)
-		return cells
+		return list(self.iter_cells_by_value(value))
+
+	def iter_cells_by_value(self, value: Any) -> Iterator[Cell]:
+		"""Iterates over cells with the specified value.
+
+		Cells are only created for matching values.
+		"""
+		# Only strings can be equal to a string, so other values are skipped
+		# without dispatching to their __eq__
+		needle_is_str = isinstance(value, str)
+		for row_idx, row_data in enumerate(self.data, 1):
+			for col_idx, cell_value in enumerate(row_data, 1):
+				if needle_is_str and not isinstance(cell_value, str):
+					continue
+				if cell_value == value:
+					yield Cell(row=row_idx, column=col_idx, value=cell_value)
 
 	def find_cells_by_pattern(self, pattern: str) -> list[Cell]:
 		"""Finds all cells whose values match the regular expression."""
-		import re
+		return self.find_cells_by_compiled_pattern(re.compile(pattern))
+
+	def find_cells_by_compiled_pattern(self, pattern: re.Pattern[str]) -> list[Cell]:
+		"""Finds all cells whose values match the compiled regular expression."""
+		return list(self.iter_cells_by_compiled_pattern(pattern))
 
-		compiled_pattern = re.compile(pattern)
-		cells = []
+	def iter_cells_by_compiled_pattern(
+		self, pattern: re.Pattern[str]
+	) -> Iterator[Cell]:
+		"""Iterates over cells whose values match the compiled regular expression.
 
-		for cell in self.get_all_cells():
-			if cell.value and compiled_pattern.search(str(cell.value)):
-				cells.append(cell)
-		return cells
+		Cells are only created for matching values.
+		"""
+		search = pattern.search
+		# Without anchors or lookarounds, a value matching the pattern makes
+		# the joined row match as well, so rows without a match are skipped
+		# after a single search
+		join = _ROW_SEPARATOR.join if _is_context_free(pattern) else None
+		for row_idx, row_data in enumerate(self.data, 1):
+			if join is not None and not search(join(map(str, row_data))):
+				continue
+			for col_idx, value in enumerate(row_data, 1):
+				if value and search(value if isinstance(value, str) else str(value)):
+					yield Cell(row=row_idx, column=col_idx, value=value)
 
 	def remove_empty_rows(self) -> 'Worksheet':
 		"""Removes empty rows from the worksheet.
@@ -239,29 +422,18 @@ class Worksheet:
 		if not self.data:
 			return self
 
-		# Filter out empty rows
-		non_empty_rows = []
-		for row in self.data:
-			# Check if row has any non-empty values
-			if any(cell is not None and str(cell).strip() for cell in row):
-				non_empty_rows.append(row)
-
-		# Calculate new dimensions
-		new_row_count = len(non_empty_rows)
-		new_column_count = (
-			max(len(row) for row in non_empty_rows) if non_empty_rows else 0
-		)
+		non_empty_rows, new_column_count = self._non_empty_rows()
 
-		# Normalize rows to have same length
-		normalized_rows = []
-		for row in non_empty_rows:
-			normalized_row = row + [None] * (new_column_count - len(row))
-			normalized_rows.append(normalized_row)
+		# Normalize rows to have same length (rows are copied, so the new
+		# worksheet never shares row lists with this one)
+		normalized_rows = [
+			row + [None] * (new_column_count - len(row)) for row in non_empty_rows
+		]
 
 		return Worksheet(
 			name=self.name,
 			data=normalized_rows,
-			row_count=new_row_count,
+			row_count=len(normalized_rows),
 			column_count=new_column_count,
 		)
 
@@ -274,29 +446,9 @@ class Worksheet:
 		if not self.data or not self.column_count:
 			return self
 
-		# Find empty columns
-		empty_columns = set()
-		for col_idx in range(self.column_count):
-			is_empty = True
-			for row in self.data:
-				if (
-					col_idx < len(row)
-					and row[col_idx] is not None
-					and str(row[col_idx]).strip()
-				):
-					is_empty = False
-					break
-			if is_empty:
-				empty_columns.add(col_idx)
-
 		# Create new data without empty columns
-		new_data = []
-		for row in self.data:
-			new_row = []
-			for col_idx, cell in enumerate(row):
-				if col_idx not in empty_columns:
-					new_row.append(cell)
-			new_data.append(new_row)
+		keep = _non_empty_column_mask(self.data, self.column_count)
+		new_data = _select_columns(self.data, keep)
 
 		# Calculate new dimensions
 		new_row_count = len(new_data)
@@ -315,9 +467,30 @@ class Worksheet:
 		Returns:
 			New Worksheet instance with cleaned data
 		"""
-		# First remove empty rows, then empty columns
-		cleaned_worksheet = self.remove_empty_rows()
-		return cleaned_worksheet.remove_empty_columns()
+		if not self.data:
+			return self
+
+		rows, width = self._non_empty_rows()
+		if not rows:
+			return Worksheet(name=self.name, data=[], row_count=0, column_count=0)
+
+		# Empty rows cannot make a column non-empty, so only the remaining
+		# rows are checked; then rows are padded and empty columns dropped
+		column_mask = _non_empty_column_mask(rows, width)
+		new_data = _select_columns(
+			[
+				row if len(row) == width else row + [None] * (width - len(row))
+				for row in rows
+			],
+			column_mask,
+		)
+
+		return Worksheet(
+			name=self.name,
+			data=new_data,
+			row_count=len(new_data),
+			column_count=len(new_data[0]),
+		)
 
 	def remove_empty_rows_inplace(self) -> None:
 		"""Removes empty rows from the worksheet in place.
@@ -327,29 +500,19 @@ class Worksheet:
 		if not self.data:
 			return
 
-		# Filter out empty rows
-		non_empty_rows = []
-		for row in self.data:
-			# Check if row has any non-empty values
-			if any(cell is not None and str(cell).strip() for cell in row):
-				non_empty_rows.append(row)
+		non_empty_rows, column_count = self._non_empty_rows()
 
-		# Update data
-		self.data = non_empty_rows
+		# Update data, padding only the rows that are too short
+		self.data = [
+			row
+			if len(row) == column_count
+			else row + [None] * (column_count - len(row))
+			for row in non_empty_rows
+		]
 
 		# Update dimensions
 		self.row_count = len(non_empty_rows)
-		self.column_count = (
-			max(len(row) for row in non_empty_rows) if non_empty_rows else 0
-		)
-
-		# Normalize rows to have same length
-		normalized_rows = []
-		for row in self.data:
-			normalized_row = row + [None] * (self.column_count - len(row))
-			normalized_rows.append(normalized_row)
-
-		self.data = normalized_rows
+		self.column_count = column_count
 
 	def remove_empty_columns_inplace(self) -> None:
 		"""Removes empty columns from the worksheet in place.
@@ -359,29 +522,9 @@ class Worksheet:
 		if not self.data or not self.column_count:
 			return
 
-		# Find empty columns
-		empty_columns = set()
-		for col_idx in range(self.column_count):
-			is_empty = True
-			for row in self.data:
-				if (
-					col_idx < len(row)
-					and row[col_idx] is not None
-					and str(row[col_idx]).strip()
-				):
-					is_empty = False
-					break
-			if is_empty:
-				empty_columns.add(col_idx)
-
 		# Create new data without empty columns
-		new_data = []
-		for row in self.data:
-			new_row = []
-			for col_idx, cell in enumerate(row):
-				if col_idx not in empty_columns:
-					new_row.append(cell)
-			new_data.append(new_row)
+		keep = _non_empty_column_mask(self.data, self.column_count)
+		new_data = _select_columns(self.data, keep)
 
 		# Update data and dimensions
 		self.data = new_data
@@ -393,13 +536,51 @@ class Worksheet:
 
 		Modifies the current worksheet object.
 		"""
-		# First remove empty rows, then empty columns
-		self.remove_empty_rows_inplace()
-		self.remove_empty_columns_inplace()
+		if not self.data:
+			return
+
+		cleaned = self.clean_data()
+		self.data = cleaned.data
+		self.row_count = cleaned.row_count
+		self.column_count = cleaned.column_count
+
+	def __eq__(self, other: object) -> bool:
+		"""Compares worksheets, checking dimensions and name before the data."""
+		if other.__class__ is not self.__class__:
+			return NotImplemented
+		# Differently sized worksheets are told apart without walking the data
+		return (
+			self.row_count == other.row_count
+			and self.column_count == other.column_count
+			and self.name == other.name
+			and self.data == other.data
+		)
 
 	def __iter__(self) -> Iterator[Cell]:
 		"""Iterator over all cells in the worksheet."""
-		return iter(self.get_all_cells())
+		return self.iter_cells()
+
+	def _row_values(self, row_number: int) -> list[Any]:
+		"""Returns values of a valid row, limited to column_count."""
+		if not self.data:
+			return [None] * self.column_count
+		return self.data[row_number - 1][: self.column_count]
+
+	def _non_empty_rows(self) -> tuple[list[list[Any]], int]:
+		"""Filters out empty rows.
+
+		Returns:
+			Tuple of non-empty rows and the length of the longest of them
+		"""
+		non_empty_rows = []
+		longest = 0
+		for row in self.data:
+			# Check if row has any non-empty values
+			if _row_has_value(row):
+				non_empty_rows.append(row)
+				if len(row) > longest:
+					longest = len(row)
+		return non_empty_rows, longest
 
 	def _is_valid_coordinates(self, row: int, column: int) -> bool:
 		"""Checks if coordinates are valid."""
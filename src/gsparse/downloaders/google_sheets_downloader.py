@@ -1,19 +1,67 @@
 """Downloader for downloading Google Sheets by URL."""
 
 import logging
-import re
+import threading
+from collections.abc import Iterator
 from typing import Any
-from urllib.parse import urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ..utils.url_utils import URLUtils
+
 logger = logging.getLogger(__name__)
 
+# Connections kept open per host. The adapters are shared by all downloaders,
+# so this leaves room for several clients downloading worksheets concurrently.
+POOL_MAXSIZE = 32
+
+
+class _SharedHTTPAdapter(HTTPAdapter):
+	"""HTTP adapter mounted on the sessions of all downloaders.
+
+	Closing one session must not drop connections other downloaders are
+	using, so close() keeps the pools open. They are bounded by the adapter's
+	pool sizes and live as long as the process.
+	"""
+
+	def close(self) -> None:
+		"""Keeps the shared connection pools open."""
+
+
+# Connection pools shared by all downloaders, keyed by retry count
+_ADAPTERS: dict[int, HTTPAdapter] = {}
+_ADAPTERS_LOCK = threading.Lock()
+
+
+def _get_shared_adapter(max_retries: int) -> HTTPAdapter:
+	"""Returns HTTP adapter with retry settings shared between sessions.
+
+	Reusing the adapter keeps its connection pool, so a new downloader does not
+	need a fresh TLS handshake for hosts already connected to.
+	"""
+	with _ADAPTERS_LOCK:
+		adapter = _ADAPTERS.get(max_retries)
+		if adapter is None:
+			retry_strategy = Retry(
+				total=max_retries,
+				backoff_factor=1,
+				status_forcelist=[429, 500, 502, 503, 504],
+			)
+			adapter = _SharedHTTPAdapter(
+				max_retries=retry_strategy, pool_maxsize=POOL_MAXSIZE
+			)
+			_ADAPTERS[max_retries] = adapter
+		return adapter
+
 
 class GoogleSheetsDownloader:
-	"""Downloader for downloading Google Sheets in various formats."""
+	"""Downloader for downloading Google Sheets in various formats.
+
+	All downloaders with the same max_retries share one connection pool, so
+	closing a downloader or its session leaves the pool open for the others.
+	"""
 
 	# Base URLs for Google Sheets export
 	EXPORT_BASE_URL = 'https://docs.google.com/spreadsheets/d/{sheet_id}/export'
@@ -27,6 +75,9 @@ class GoogleSheetsDownloader:
 		'pdf': 'pdf',
 	}
 
+	# Size of chunks yielded by stream_sheet
+	DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 	def __init__(self, timeout: int = 30, max_retries: int = 3):
 		"""Initialize downloader.
 
@@ -41,18 +92,19 @@ class GoogleSheetsDownloader:
 		"""Creates HTTP session with retry settings."""
 		session = requests.Session()
 
-		retry_strategy = Retry(
-			total=max_retries,
-			backoff_factor=1,
-			status_forcelist=[429, 500, 502, 503, 504],
-		)
-
-		adapter = HTTPAdapter(max_retries=retry_strategy)
+		adapter = _get_shared_adapter(max_retries)
 		session.mount('http://', adapter)
 		session.mount('https://', adapter)
 
 		return session
 
+	def close(self) -> None:
+		"""Closes the HTTP session.
+
+		The shared connection pools stay open for other downloaders.
+		"""
+		self.session.close()
+
 	def extract_sheet_id(self, url: str) -> str | None:
 		"""Extracts sheet ID from Google Sheets URL.
 
@@ -62,27 +114,13 @@ class GoogleSheetsDownloader:
 		Returns:
 		    Sheet ID or None if extraction failed
 		"""
-		# Patterns for various Google Sheets URL formats
-		patterns = [
-			r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-			r'id=([a-zA-Z0-9-_]+)',
-			r'key=([a-zA-Z0-9-_]+)',
-		]
-
-		for pattern in patterns:
-			match = re.search(pattern, url)
-			if match:
-				return match.group(1)
-
-		return None
+		# Shares the precompiled URL patterns with URLUtils
+		return URLUtils.extract_sheet_id(url)
 
 	def is_valid_google_sheets_url(self, url: str) -> bool:
 		"""Checks if URL is a valid Google Sheets URL."""
-		parsed = urlparse(url)
-		return (
-			parsed.netloc in ['docs.google.com', 'drive.google.com']
-			and self.extract_sheet_id(url) is not None
-		)
+		# Memoized per URL, repeated downloads of a sheet skip the regex scans
+		return URLUtils.is_google_sheets_url(url)
 
 	def get_export_url(
 		self, sheet_id: str, format_type: str = 'csv', gid: str | None = None
@@ -101,14 +139,11 @@ class GoogleSheetsDownloader:
 			raise ValueError(f'Unsupported format: {format_type}')
 
 		url = self.EXPORT_BASE_URL.format(sheet_id=sheet_id)
-		params = {'format': self.FORMATS[format_type]}
-
-		if gid:
-			params['gid'] = gid
 
 		# Add parameters to URL
-		param_string = '&'.join([f'{k}={v}' for k, v in params.items()])
-		return f'{url}?{param_string}'
+		if gid:
+			return f'{url}?format={self.FORMATS[format_type]}&gid={gid}'
+		return f'{url}?format={self.FORMATS[format_type]}'
 
 	def download_sheet(
 		self, url: str, format_type: str = 'csv', gid: str | None = None
@@ -127,14 +162,7 @@ class GoogleSheetsDownloader:
 		    ValueError: If URL is invalid
 		    requests.RequestException: If download error occurred
 		"""
-		if not self.is_valid_google_sheets_url(url):
-			raise ValueError(f'Invalid Google Sheets URL: {url}')
-
-		sheet_id = self.extract_sheet_id(url)
-		if not sheet_id:
-			raise ValueError('Failed to extract sheet ID from URL')
-
-		export_url = self.get_export_url(sheet_id, format_type, gid)
+		export_url = self._get_validated_export_url(url, format_type, gid)
 
 		try:
 			response = self.session.get(export_url, timeout=self.timeout)
@@ -145,6 +173,65 @@ class GoogleSheetsDownloader:
 				f'Error downloading spreadsheet: {e}'
 			) from e
 
+	def stream_sheet(
+		self,
+		url: str,
+		format_type: str = 'csv',
+		gid: str | None = None,
+		chunk_size: int | None = None,
+	) -> Iterator[bytes]:
+		"""Downloads sheet in specified format chunk by chunk.
+
+		Unlike download_sheet, the response body is never held in memory as a
+		whole, which suits writing large exports to a file.
+
+		Args:
+		    url: Google Sheets URL
+		    format_type: Export format type
+		    gid: Sheet ID (optional)
+		    chunk_size: Maximum chunk size in bytes (default DOWNLOAD_CHUNK_SIZE)
+
+		Yields:
+		    Chunks of downloaded file
+
+		Raises:
+		    ValueError: If URL is invalid
+		    requests.RequestException: If download error occurred
+		"""
+		# Validate before the generator is first advanced
+		export_url = self._get_validated_export_url(url, format_type, gid)
+		return self._iter_export(export_url, chunk_size or self.DOWNLOAD_CHUNK_SIZE)
+
+	def _iter_export(self, export_url: str, chunk_size: int) -> Iterator[bytes]:
+		"""Yields chunks of export response body."""
+		try:
+			with self.session.get(
+				export_url, timeout=self.timeout, stream=True
+			) as response:
+				response.raise_for_status()
+				yield from response.iter_content(chunk_size)
+		except requests.RequestException as e:
+			raise requests.RequestException(
+				f'Error downloading spreadsheet: {e}'
+			) from e
+
+	def _get_validated_export_url(
+		self, url: str, format_type: str, gid: str | None
+	) -> str:
+		"""Validates sheet URL and creates its export URL.
+
+		Raises:
+		    ValueError: If URL is invalid
+		"""
+		if not self.is_valid_google_sheets_url(url):
+			raise ValueError(f'Invalid Google Sheets URL: {url}')
+
+		sheet_id = self.extract_sheet_id(url)
+		if not sheet_id:
+			raise ValueError('Failed to extract sheet ID from URL')
+
+		return self.get_export_url(sheet_id, format_type, gid)
+
 	def get_sheet_info(self, url: str) -> dict[str, Any]:
 		"""Gets information about the sheet.
 
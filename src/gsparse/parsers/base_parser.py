@@ -1,25 +1,76 @@
 """Base class for parsers."""
 
+import codecs
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Any
 
+try:
+	import cchardet as _charset_detector
+except ImportError:  # optional dependency
+	import charset_normalizer as _charset_detector
+
 from ..core.spreadsheet import Spreadsheet
 from ..core.worksheet import Worksheet
 
 logger = logging.getLogger(__name__)
 
+# Number of leading bytes used to detect the encoding
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Minimum number of non-ASCII bytes for a detector guess to be trusted. On
+# less, charset-normalizer confidently reports e.g. Big5 for short CP1251 text.
+MIN_DETECTION_NON_ASCII = 64
+
+_ASCII_BYTES = bytes(range(128))
+
+
+@lru_cache(maxsize=64)
+def _detect_encoding_cached(sample: bytes) -> str:
+	"""Detects the encoding of a sample with the charset detector.
+
+	Samples with too few non-ASCII bytes are reported as UTF-8, so parsers
+	try their fallback encodings instead of a guess on too little evidence.
+	Results are memoized, so re-parsing the same payload skips detection.
+
+	Args:
+		sample: Leading bytes of the data
+
+	Returns:
+		Encoding name
+	"""
+	if len(sample.translate(None, _ASCII_BYTES)) < MIN_DETECTION_NON_ASCII:
+		return 'utf-8'
+
+	# Try to detect encoding (cchardet if installed, otherwise charset-normalizer)
+	result = _charset_detector.detect(sample)
+	encoding = result.get('encoding')
+	# charset-normalizer reports None instead of 0 for undetectable data
+	confidence = result.get('confidence') or 0
+
+	# If confidence is low, use utf-8 by default
+	if not encoding or confidence < 0.7:
+		encoding = 'utf-8'
+
+	return encoding
+
 
 class BaseParser(ABC):
 	"""Base class for all parsers."""
 
-	def __init__(self, preserve_strings: bool = False):
+	def __init__(self, preserve_strings: bool = False, max_workers: int = 1):
 		"""Initialize parser.
 
 		Args:
 			preserve_strings: If True, all values will be kept as strings without type conversion
+			max_workers: Number of processes used by parse_multiple, 1 parses
+				sequentially in the calling process
 		"""
 		self.preserve_strings = preserve_strings
+		self.max_workers = max_workers
 
 	@abstractmethod
 	def parse(self, data: bytes, worksheet_name: str = 'Sheet1') -> Worksheet:
@@ -46,6 +97,24 @@ class BaseParser(ABC):
 		"""
 		pass
 
+	def _parse_all(self, data_dict: dict[str, bytes]) -> list[Worksheet]:
+		"""Parses every data set, in worker processes if max_workers > 1.
+
+		Args:
+			data_dict: Dictionary {worksheet_name: data}
+
+		Returns:
+			List of worksheets in data_dict order
+		"""
+		names = list(data_dict)
+		max_workers = min(self.max_workers, len(names))
+		if max_workers <= 1:
+			return [self.parse(data_dict[name], name) for name in names]
+
+		# Parsing is CPU bound, so threads would be serialized by the GIL
+		with ProcessPoolExecutor(max_workers=max_workers) as executor:
+			return list(executor.map(self.parse, data_dict.values(), names))
+
 	def _clean_cell_value(self, value: Any) -> Any:
 		"""Cleans cell value from extra characters.
 
@@ -55,42 +124,103 @@ class BaseParser(ABC):
 		Returns:
 			Cleaned value
 		"""
-		if value is None:
-			return None
-
+		# Strings are by far the most common values, so check them first
 		if isinstance(value, str):
 			# Remove extra spaces and line breaks
-			cleaned = value.strip().replace('\r\n', '\n').replace('\r', '\n')
+			cleaned = value.strip()
+
+			# Most values have no carriage returns, so skip the copies
+			if '\r' in cleaned:
+				cleaned = cleaned.replace('\r\n', '\n').replace('\r', '\n')
+
 			# If string is empty after cleaning, return None
-			if not cleaned:
-				return None
+			return cleaned or None
 
-			return cleaned
+		if value is None:
+			return None
 
 		# If preserve_strings is True, convert all values to strings
 		if self.preserve_strings:
-			return str(value) if value is not None else None
+			return str(value)
 
 		return value
 
-	def _detect_encoding(self, data: bytes) -> str:
-		"""Detects data encoding.
+	def _clean_rows(
+		self, rows: Iterable[Iterable[Any]], line_breaks: bool = True
+	) -> list[list[Any]]:
+		"""Cleans values of all rows at once.
 
 		Args:
-			data: Data bytes
+			rows: Rows of original values
+			line_breaks: False if no value contains a carriage return, which
+				lets strings skip line break normalization
 
 		Returns:
-			Encoding name
+			Rows of cleaned values
+		"""
+		clean = self._clean_cell_value
+		if line_breaks:
+			return [[clean(value) for value in row] for row in rows]
+
+		# Strings only need stripping, so they are handled inline
+		return [
+			[
+				(value.strip() or None) if type(value) is str else clean(value)
+				for value in row
+			]
+			for row in rows
+		]
+
+	@staticmethod
+	def _pad_rows(rows: list[list[Any]]) -> int:
+		"""Pads rows in place with empty values to the same length.
+
+		Args:
+			rows: Rows of values
+
+		Returns:
+			Column count of the padded rows
 		"""
-		import chardet
+		column_count = max(map(len, rows), default=0)
+		# Rows read by openpyxl and most CSV files are already uniform
+		if min(map(len, rows), default=0) == column_count:
+			return column_count
+
+		for row in rows:
+			if len(row) < column_count:
+				row.extend([None] * (column_count - len(row)))
 
-		# Try to detect encoding
-		result = chardet.detect(data)
-		encoding = result.get('encoding', 'utf-8')
-		confidence = result.get('confidence', 0)
+		return column_count
 
-		# If confidence is low, use utf-8 by default
-		if confidence < 0.7:
-			encoding = 'utf-8'
+	def _detect_encoding(
+		self, data: bytes, sample_size: int = ENCODING_SAMPLE_SIZE
+	) -> str:
+		"""Detects data encoding.
+
+		Only the first sample_size bytes are examined.
 
-		return encoding
+		Args:
+			data: Data bytes
+			sample_size: Number of leading bytes to examine
+
+		Returns:
+			Encoding name
+		"""
+		if data.startswith(codecs.BOM_UTF8):
+			return 'utf-8-sig'
+		if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+			return 'utf-16'
+
+		# Google Sheets exports are UTF-8, so check that before the detector.
+		# A multi-byte character cut off at the end of the sample is allowed.
+		sample = data[:sample_size]
+		try:
+			codecs.getincrementaldecoder('utf-8')().decode(
+				sample, final=len(sample) == len(data)
+			)
+		except UnicodeDecodeError:
+			pass
+		else:
+			return 'utf-8'
+
+		return _detect_encoding_cached(sample)
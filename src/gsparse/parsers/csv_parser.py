@@ -1,25 +1,40 @@
 """Parser for CSV data."""
 
+import codecs
 import csv
 import io
 import logging
+import re
+from itertools import islice
+from typing import Any
 
 from ..core.spreadsheet import Spreadsheet
 from ..core.worksheet import Worksheet
-from .base_parser import BaseParser
+from .base_parser import ENCODING_SAMPLE_SIZE, BaseParser
 
 logger = logging.getLogger(__name__)
 
+# Quoted field patterns like 'value' or "value", by quote character
+_QUOTE_PATTERNS = {
+	quote_char: re.compile(f'^{re.escape(quote_char)}.*{re.escape(quote_char)}$')
+	for quote_char in ('"', "'", '`')
+}
+
 
 class CSVParser(BaseParser):
 	"""Parser for CSV data from Google Sheets."""
 
+	# Number of leading lines analyzed by detect_delimiter
+	DETECT_LINES = 5
+
 	def __init__(
 		self,
 		delimiter: str = ',',
 		quotechar: str = '"',
 		encoding: str | None = None,
 		preserve_strings: bool = False,
+		sample_size: int = ENCODING_SAMPLE_SIZE,
+		max_workers: int = 1,
 	):
 		"""Initialize parser.
 
@@ -28,11 +43,14 @@ class CSVParser(BaseParser):
 			quotechar: Quote character
 			encoding: Encoding (if None, auto-detected)
 			preserve_strings: If True, all values will be kept as strings without type conversion
+			sample_size: Number of leading bytes used to auto-detect the encoding
+			max_workers: Number of processes used by parse_multiple
 		"""
-		super().__init__(preserve_strings)
+		super().__init__(preserve_strings, max_workers)
 		self.delimiter = delimiter
 		self.quotechar = quotechar
 		self.encoding = encoding
+		self.sample_size = sample_size
 
 	def parse(self, data: bytes, worksheet_name: str = 'Sheet1') -> Worksheet:
 		"""Parses CSV data and returns Worksheet.
@@ -45,16 +63,19 @@ class CSVParser(BaseParser):
 			Worksheet object
 		"""
 		# Detect encoding if not specified
-		encoding = self.encoding or self._detect_encoding(data)
+		encoding = self.encoding or self._detect_encoding(data, self.sample_size)
 
 		try:
-			# Decode data
-			text_data = data.decode(encoding)
+			rows = self._read_rows(data, encoding)
 		except UnicodeDecodeError:
-			# If decoding failed, try other encodings
+			# If decoding failed, try other encodings, skipping the one that
+			# already failed instead of decoding the whole data again
+			failed = codecs.lookup(encoding).name
 			for fallback_encoding in ['utf-8', 'cp1251', 'latin-1', 'utf-16']:
+				if codecs.lookup(fallback_encoding).name == failed:
+					continue
 				try:
-					text_data = data.decode(fallback_encoding)
+					rows = self._read_rows(data, fallback_encoding)
 					logger.debug(f'Successfully decoded with {fallback_encoding}')
 					break
 				except UnicodeDecodeError:
@@ -62,46 +83,46 @@ class CSVParser(BaseParser):
 			else:
 				raise ValueError('Failed to decode data with any supported encoding')
 
-		# Auto-detect quote character if not explicitly set
-		quotechar = self.quotechar
-		if quotechar == '"':  # Only auto-detect if using default
-			quotechar = self._detect_quote_char(text_data)
-
-		# Parse CSV
-		csv_reader = csv.reader(
-			io.StringIO(text_data), delimiter=self.delimiter, quotechar=quotechar
-		)
-
-		# Read all rows
-		rows = list(csv_reader)
-
 		if not rows:
 			# If no data, create empty worksheet
 			return Worksheet(name=worksheet_name, data=[], row_count=0, column_count=0)
 
-		# Clean data
-		cleaned_rows = []
-		for row in rows:
-			cleaned_row = [self._clean_cell_value(cell) for cell in row]
-			cleaned_rows.append(cleaned_row)
-
-		# Determine dimensions
-		row_count = len(cleaned_rows)
-		column_count = max(len(row) for row in cleaned_rows) if cleaned_rows else 0
-
 		# Normalize rows (pad with empty values to same length)
-		normalized_rows = []
-		for row in cleaned_rows:
-			normalized_row = row + [None] * (column_count - len(row))
-			normalized_rows.append(normalized_row)
+		column_count = self._pad_rows(rows)
 
 		return Worksheet(
 			name=worksheet_name,
-			data=normalized_rows,
-			row_count=row_count,
+			data=rows,
+			row_count=len(rows),
 			column_count=column_count,
 		)
 
+	def _read_rows(self, data: bytes, encoding: str) -> list[list[Any]]:
+		"""Decodes, reads and cleans CSV rows incrementally.
+
+		Args:
+			data: CSV data bytes
+			encoding: Encoding of the data
+
+		Returns:
+			Rows of cleaned values
+
+		Raises:
+			UnicodeDecodeError: If data cannot be decoded with the encoding
+		"""
+		text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, newline='')
+
+		# Auto-detect quote character if not explicitly set
+		quotechar = self.quotechar
+		if quotechar == '"':  # Only auto-detect if using default
+			quotechar = self._detect_quote_char(''.join(islice(text, 5)))
+			text.seek(0)
+
+		csv_reader = csv.reader(text, delimiter=self.delimiter, quotechar=quotechar)
+
+		# '\r' contains a 0x0D byte in every supported encoding
+		return self._clean_rows(csv_reader, line_breaks=b'\r' in data)
+
 	def parse_multiple(self, data_dict: dict[str, bytes]) -> Spreadsheet:
 		"""Parses multiple CSV files and returns Spreadsheet.
 
@@ -111,11 +132,7 @@ class CSVParser(BaseParser):
 		Returns:
 			Spreadsheet object
 		"""
-		worksheets = []
-
-		for worksheet_name, data in data_dict.items():
-			worksheet = self.parse(data, worksheet_name)
-			worksheets.append(worksheet)
+		worksheets = self._parse_all(data_dict)
 
 		# Use first worksheet name as spreadsheet title
 		title = list(data_dict.keys())[0] if data_dict else 'Untitled'
@@ -149,24 +166,16 @@ class CSVParser(BaseParser):
 		lines = text_data.split('\n')[:5]
 
 		# Count frequency of different quote characters
-		quote_chars = ['"', "'", '`']
-		quote_counts = {}
-
-		for quote_char in quote_chars:
-			count = 0
-			for line in lines:
-				if line.strip():
-					# Count occurrences where quote appears at start/end of fields
-					# Look for patterns like 'value' or "value"
-					import re
+		quote_counts = dict.fromkeys(_QUOTE_PATTERNS, 0)
 
-					pattern = f'^{re.escape(quote_char)}.*{re.escape(quote_char)}$'
-					fields = line.split(self.delimiter)
+		for line in lines:
+			if line.strip():
+				# Count occurrences where quote appears at start/end of fields
+				fields = [field.strip() for field in line.split(self.delimiter)]
+				for quote_char, pattern in _QUOTE_PATTERNS.items():
 					for field in fields:
-						field = field.strip()
-						if re.match(pattern, field):
-							count += 1
-			quote_counts[quote_char] = count
+						if pattern.match(field):
+							quote_counts[quote_char] += 1
 
 		# Return quote character with highest frequency, default to double quotes
 		return (
@@ -184,11 +193,17 @@ class CSVParser(BaseParser):
 		Returns:
 			Found delimiter
 		"""
-		encoding = self.encoding or self._detect_encoding(data)
-		text_data = data.decode(encoding)
+		encoding = self.encoding or self._detect_encoding(data, self.sample_size)
+
+		# Only the first lines are analyzed, so decode just the sample. A
+		# multi-byte character cut off at the end of the sample is allowed.
+		sample = data[: self.sample_size]
+		text_data = codecs.getincrementaldecoder(encoding)().decode(
+			sample, final=len(sample) == len(data)
+		)
 
 		# Read first few lines for analysis
-		lines = text_data.split('\n')[:5]
+		lines = text_data.split('\n')[: self.DETECT_LINES]
 
 		# Count frequency of different delimiters
 		delimiters = [',', ';', '\t', '|']
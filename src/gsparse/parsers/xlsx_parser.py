@@ -2,6 +2,8 @@
 
 import io
 import logging
+from datetime import date, datetime
+from typing import Any
 
 from openpyxl import load_workbook
 
@@ -9,22 +11,47 @@ from ..core.spreadsheet import Spreadsheet
 from ..core.worksheet import Worksheet
 from .base_parser import BaseParser
 
+try:
+	from python_calamine import CalamineWorkbook
+except ImportError:  # optional dependency
+	CalamineWorkbook = None
+
 logger = logging.getLogger(__name__)
 
+BACKENDS = ('calamine', 'openpyxl')
+
 
 class XLSXParser(BaseParser):
 	"""Parser for XLSX data from Google Sheets."""
 
-	def __init__(self, data_only: bool = True, preserve_strings: bool = False):
+	def __init__(
+		self,
+		data_only: bool = True,
+		preserve_strings: bool = False,
+		backend: str = 'openpyxl',
+		max_workers: int = 1,
+	):
 		"""Initialize parser.
 
 		Args:
 		    data_only: If True, only read cell values, not formulas
 		    preserve_strings: If True, all values will be kept as strings without type conversion
+		    backend: Workbook reader, 'openpyxl' or 'calamine'. calamine is much
+		        faster but needs python-calamine and reads cached values only.
+		        It returns integral numbers as int, even for cells stored as
+		        floats (1.0), which openpyxl returns as float
+		    max_workers: Number of processes used by parse_multiple
 		"""
-		super().__init__(preserve_strings)
+		super().__init__(preserve_strings, max_workers)
 		self.data_only = data_only
 
+		if backend not in BACKENDS:
+			raise ValueError(f'Unknown XLSX backend: {backend}')
+		elif backend == 'calamine' and CalamineWorkbook is None:
+			raise ValueError('python-calamine is not installed')
+
+		self.backend = backend
+
 	def parse(self, data: bytes, worksheet_name: str = 'Sheet1') -> Worksheet:
 		"""Parses XLSX data and returns Worksheet.
 
@@ -36,49 +63,75 @@ class XLSXParser(BaseParser):
 		    Worksheet object
 		"""
 		try:
-			# Load workbook from bytes
-			workbook = load_workbook(
-				io.BytesIO(data), data_only=self.data_only, read_only=True
-			)
-
-			# Get the specified worksheet
-			if worksheet_name in workbook.sheetnames:
-				worksheet = workbook[worksheet_name]
-			else:
-				# If worksheet not found, use the first one
-				worksheet = workbook.active
-				worksheet_name = worksheet.title
-
-			# Convert worksheet to our format
-			rows = []
-			for row in worksheet.iter_rows(values_only=True):
-				# Clean cell values
-				cleaned_row = [self._clean_cell_value(cell) for cell in row]
-				rows.append(cleaned_row)
-
-			# Determine dimensions
-			row_count = len(rows)
-			column_count = max(len(row) for row in rows) if rows else 0
-
-			# Normalize rows (pad with empty values to same length)
-			normalized_rows = []
-			for row in rows:
-				normalized_row = row + [None] * (column_count - len(row))
-				normalized_rows.append(normalized_row)
+			if self.backend == 'calamine':
+				return self._parse_calamine(data, worksheet_name)
 
-			workbook.close()
-
-			return Worksheet(
-				name=worksheet_name,
-				data=normalized_rows,
-				row_count=row_count,
-				column_count=column_count,
-			)
+			return self._parse_openpyxl(data, worksheet_name)
 
 		except Exception as e:
 			logger.error(f'Error parsing XLSX data: {e}')
 			raise ValueError(f'Failed to parse XLSX data: {e}') from e
 
+	def _parse_calamine(self, data: bytes, worksheet_name: str) -> Worksheet:
+		"""Reads one worksheet with python-calamine.
+
+		Args:
+		    data: XLSX data bytes
+		    worksheet_name: Worksheet name, the active worksheet is used if not found
+
+		Returns:
+		    Worksheet object
+		"""
+		workbook = CalamineWorkbook.from_filelike(io.BytesIO(data))
+
+		try:
+			if worksheet_name in workbook.sheet_names:
+				return self._read_calamine_sheet(workbook, worksheet_name)
+		finally:
+			workbook.close()
+
+		# calamine doesn't expose the active worksheet, so let openpyxl pick
+		# the same one it would use for an unknown name
+		return self._parse_openpyxl(data, worksheet_name)
+
+	def _parse_openpyxl(self, data: bytes, worksheet_name: str) -> Worksheet:
+		"""Reads one worksheet with openpyxl.
+
+		Args:
+		    data: XLSX data bytes
+		    worksheet_name: Worksheet name, the active worksheet is used if not found
+
+		Returns:
+		    Worksheet object
+		"""
+		# Load workbook from bytes
+		workbook = load_workbook(
+			io.BytesIO(data), data_only=self.data_only, read_only=True
+		)
+
+		# Get the specified worksheet
+		if worksheet_name in workbook.sheetnames:
+			worksheet = workbook[worksheet_name]
+		else:
+			# If worksheet not found, use the first one
+			worksheet = workbook.active
+			worksheet_name = worksheet.title
+
+		# Convert worksheet to our format
+		rows = self._clean_rows(worksheet.iter_rows(values_only=True))
+
+		# Normalize rows (pad with empty values to same length)
+		column_count = self._pad_rows(rows)
+
+		workbook.close()
+
+		return Worksheet(
+			name=worksheet_name,
+			data=rows,
+			row_count=len(rows),
+			column_count=column_count,
+		)
+
 	def parse_multiple(self, data_dict: dict[str, bytes]) -> Spreadsheet:
 		"""Parses multiple XLSX files and returns Spreadsheet.
 
@@ -88,11 +141,7 @@ class XLSXParser(BaseParser):
 		Returns:
 		    Spreadsheet object
 		"""
-		worksheets = []
-
-		for worksheet_name, data in data_dict.items():
-			worksheet = self.parse(data, worksheet_name)
-			worksheets.append(worksheet)
+		worksheets = self._parse_all(data_dict)
 
 		# Use first worksheet name as spreadsheet title
 		title = list(data_dict.keys())[0] if data_dict else 'Untitled'
@@ -109,11 +158,97 @@ class XLSXParser(BaseParser):
 		    Spreadsheet object with all worksheets
 		"""
 		try:
-			# Load workbook from bytes
-			workbook = load_workbook(
-				io.BytesIO(data), data_only=self.data_only, read_only=True
-			)
+			if self.backend == 'calamine':
+				worksheets = self._parse_workbook_calamine(data)
+			else:
+				worksheets = self._parse_workbook_openpyxl(data)
+
+			# Use first worksheet name as spreadsheet title
+			title = worksheets[0].name if worksheets else 'Untitled'
+
+			return Spreadsheet(title=title, worksheets=worksheets)
+
+		except Exception as e:
+			logger.error('Error parsing XLSX workbook: %s', e)
+			raise ValueError(f'Failed to parse XLSX workbook: {e}') from e
+
+	def _parse_workbook_calamine(self, data: bytes) -> list[Worksheet]:
+		"""Reads all worksheets with python-calamine.
+
+		Args:
+		    data: XLSX data bytes
 
+		Returns:
+		    List of worksheets in workbook order
+		"""
+		workbook = CalamineWorkbook.from_filelike(io.BytesIO(data))
+
+		try:
+			return [
+				self._read_calamine_sheet(workbook, sheet_name)
+				for sheet_name in workbook.sheet_names
+			]
+
+		finally:
+			workbook.close()
+
+	def _read_calamine_sheet(
+		self, workbook: 'CalamineWorkbook', sheet_name: str
+	) -> Worksheet:
+		"""Converts a python-calamine worksheet to our format.
+
+		Args:
+		    workbook: Open calamine workbook
+		    sheet_name: Worksheet name
+
+		Returns:
+		    Worksheet object
+		"""
+		# Rows come back already padded to the sheet dimension
+		rows = workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+		clean = self._clean_calamine_value
+		data_rows = [[clean(value) for value in row] for row in rows]
+
+		return Worksheet(
+			name=sheet_name,
+			data=data_rows,
+			row_count=len(data_rows),
+			column_count=len(data_rows[0]) if data_rows else 0,
+		)
+
+	def _clean_calamine_value(self, value: Any) -> Any:
+		"""Converts calamine value to the type openpyxl would return.
+
+		Args:
+		    value: Value read by calamine
+
+		Returns:
+		    Cleaned value
+		"""
+		# calamine reads every number as float and midnight datetimes as dates.
+		# A float cell holding an integral value (1.0) becomes int as well,
+		# where openpyxl would keep it as float.
+		if type(value) is float and value.is_integer():
+			value = int(value)
+		elif type(value) is date:
+			value = datetime(value.year, value.month, value.day)
+
+		return self._clean_cell_value(value)
+
+	def _parse_workbook_openpyxl(self, data: bytes) -> list[Worksheet]:
+		"""Reads all worksheets with openpyxl.
+
+		Args:
+		    data: XLSX data bytes
+
+		Returns:
+		    List of worksheets in workbook order
+		"""
+		workbook = load_workbook(
+			io.BytesIO(data), data_only=self.data_only, read_only=True
+		)
+
+		try:
 			worksheets = []
 
 			# Process each worksheet
@@ -121,41 +256,24 @@ class XLSXParser(BaseParser):
 				worksheet = workbook[sheet_name]
 
 				# Convert worksheet to our format
-				rows = []
-				for row in worksheet.iter_rows(values_only=True):
-					# Clean cell values
-					cleaned_row = [self._clean_cell_value(cell) for cell in row]
-					rows.append(cleaned_row)
-
-				# Determine dimensions
-				row_count = len(rows)
-				column_count = max(len(row) for row in rows) if rows else 0
+				rows = self._clean_rows(worksheet.iter_rows(values_only=True))
 
 				# Normalize rows (pad with empty values to same length)
-				normalized_rows = []
-				for row in rows:
-					normalized_row = row + [None] * (column_count - len(row))
-					normalized_rows.append(normalized_row)
+				column_count = self._pad_rows(rows)
 
 				worksheets.append(
 					Worksheet(
 						name=sheet_name,
-						data=normalized_rows,
-						row_count=row_count,
+						data=rows,
+						row_count=len(rows),
 						column_count=column_count,
 					)
 				)
 
-			workbook.close()
-
-			# Use first worksheet name as spreadsheet title
-			title = worksheets[0].name if worksheets else 'Untitled'
-
-			return Spreadsheet(title=title, worksheets=worksheets)
+			return worksheets
 
-		except Exception as e:
-			logger.error(f'Error parsing XLSX workbook: {e}')
-			raise ValueError(f'Failed to parse XLSX workbook: {e}') from e
+		finally:
+			workbook.close()
 
 	def get_worksheet_names(self, data: bytes) -> list[str]:
 		"""Gets list of worksheet names from XLSX file.
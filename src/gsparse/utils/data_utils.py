@@ -2,10 +2,51 @@
 
 import logging
 import re
+from itertools import compress, zip_longest
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Simple patterns for dates
+_DATE_RE = re.compile(
+	r'\d{1,2}/\d{1,2}/\d{4}'  # MM/DD/YYYY
+	r'|\d{4}-\d{1,2}-\d{1,2}'  # YYYY-MM-DD
+	r'|\d{1,2}\.\d{1,2}\.\d{4}'  # DD.MM.YYYY
+)
+
+# Unicode escape sequences like \U0001F600 or \u00e9
+_UNICODE_ESCAPE_RE = re.compile(r'\\U([0-9a-fA-F]{8})|\\u([0-9a-fA-F]{4})')
+
+# Strings recognized by convert_to_boolean
+_BOOLEAN_STRINGS = frozenset(('true', '1', 'yes', 'false', '0', 'no'))
+
+
+def _is_blank(value: Any) -> bool:
+	"""Checks if value is None or a whitespace-only string.
+
+	Args:
+	    value: Value to check
+
+	Returns:
+	    True if value is blank
+	"""
+	return value is None or (isinstance(value, str) and (not value or value.isspace()))
+
+
+def _replace_unicode_escape(match: re.Match) -> str:
+	"""Replaces a matched Unicode escape sequence with its character.
+
+	Args:
+	    match: Match of _UNICODE_ESCAPE_RE
+
+	Returns:
+	    Decoded character, or the original sequence if it is out of range
+	"""
+	try:
+		return chr(int(match.group(1) or match.group(2), 16))
+	except (ValueError, OverflowError):
+		return match.group(0)
+
 
 class DataUtils:
 	"""Utilities for processing data from Google Sheets."""
@@ -28,7 +69,10 @@ class DataUtils:
 			decoded = DataUtils._decode_unicode_escapes(value)
 
 			# Remove extra spaces and line breaks
-			cleaned = decoded.strip().replace('\r\n', '\n').replace('\r', '\n')
+			cleaned = decoded.strip()
+			# Most values have no carriage returns, so skip the copies
+			if '\r' in cleaned:
+				cleaned = cleaned.replace('\r\n', '\n').replace('\r', '\n')
 			# If string is empty after cleaning, return None
 			return cleaned if cleaned else None
 
@@ -49,23 +93,11 @@ class DataUtils:
 
 		# Check if text contains Unicode escape sequences
 		if '\\U' in text or '\\u' in text:
-			import re
-
-			# Use regex to find and replace Unicode escape sequences
-			def replace_unicode_escape(match):
-				escape_seq = match.group(0)
-				try:
-					# Decode only the escape sequence, not the whole string
-					decoded_char = escape_seq.encode().decode('unicode_escape')
-					return decoded_char
-				except Exception:
-					return escape_seq  # Return original if decoding fails
-
-			# Pattern for Unicode escape sequences
-			unicode_pattern = r'\\U[0-9a-fA-F]{8}|\\u[0-9a-fA-F]{4}'
-			result = re.sub(unicode_pattern, replace_unicode_escape, text)
-
-			logger.debug(f'Decoded Unicode escapes: {text[:50]}... -> {result[:50]}...')
+			result = _UNICODE_ESCAPE_RE.sub(_replace_unicode_escape, text)
+
+			logger.debug(
+				'Decoded Unicode escapes: %s... -> %s...', text[:50], result[:50]
+			)
 			return result
 
 		return text
@@ -151,14 +183,28 @@ class DataUtils:
 			if value is None:
 				continue
 
-			if DataUtils.convert_to_number(value) is not None:
+			# Same checks as convert_to_number, convert_to_boolean and
+			# _is_date_like, but the string is stripped and parsed only once
+			if isinstance(value, (int, float)):
 				type_counts['number'] += 1
-			elif DataUtils.convert_to_boolean(value) is not None:
-				type_counts['boolean'] += 1
-			elif DataUtils._is_date_like(value):
-				type_counts['date'] += 1
-			else:
+				continue
+			if not isinstance(value, str):
 				type_counts['text'] += 1
+				continue
+
+			cleaned = value.strip()
+			try:
+				# Every string accepted by int() is also accepted by float()
+				float(cleaned)
+			except ValueError:
+				if cleaned.lower() in _BOOLEAN_STRINGS:
+					type_counts['boolean'] += 1
+				elif _DATE_RE.match(cleaned):
+					type_counts['date'] += 1
+				else:
+					type_counts['text'] += 1
+			else:
+				type_counts['number'] += 1
 
 		# Return the most frequent type
 		return max(type_counts, key=lambda x: type_counts[x])
@@ -176,18 +222,7 @@ class DataUtils:
 		if not isinstance(value, str):
 			return False
 
-		# Simple patterns for dates
-		date_patterns = [
-			r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY
-			r'\d{4}-\d{1,2}-\d{1,2}',  # YYYY-MM-DD
-			r'\d{1,2}\.\d{1,2}\.\d{4}',  # DD.MM.YYYY
-		]
-
-		for pattern in date_patterns:
-			if re.match(pattern, value.strip()):
-				return True
-
-		return False
+		return _DATE_RE.match(value.strip()) is not None
 
 	@staticmethod
 	def find_empty_rows(data: list[list[Any]]) -> list[int]:
@@ -199,13 +234,7 @@ class DataUtils:
 		Returns:
 		    List of empty row indices (starting from 0)
 		"""
-		empty_rows = []
-
-		for i, row in enumerate(data):
-			if not row or all(cell is None or str(cell).strip() == '' for cell in row):
-				empty_rows.append(i)
-
-		return empty_rows
+		return [i for i, row in enumerate(data) if not row or all(map(_is_blank, row))]
 
 	@staticmethod
 	def find_empty_columns(data: list[list[Any]]) -> list[int]:
@@ -220,20 +249,13 @@ class DataUtils:
 		if not data:
 			return []
 
-		empty_columns = []
-		max_cols = max(len(row) for row in data) if data else 0
-
-		for col in range(max_cols):
-			is_empty = True
-			for row in data:
-				if col < len(row) and row[col] is not None and str(row[col]).strip():
-					is_empty = False
-					break
-
-			if is_empty:
-				empty_columns.append(col)
-
-		return empty_columns
+		# zip_longest transposes the rows in C, padding short rows with None,
+		# then all() stops at the first non-blank value of each column
+		return [
+			i
+			for i, column in enumerate(zip_longest(*data))
+			if all(map(_is_blank, column))
+		]
 
 	@staticmethod
 	def remove_empty_rows(data: list[list[Any]]) -> list[list[Any]]:
@@ -245,11 +267,7 @@ class DataUtils:
 		Returns:
 		    Data without empty rows
 		"""
-		return [
-			row
-			for row in data
-			if row and any(cell is not None and str(cell).strip() for cell in row)
-		]
+		return [row for row in data if row and not all(map(_is_blank, row))]
 
 	@staticmethod
 	def remove_empty_columns(data: list[list[Any]]) -> list[list[Any]]:
@@ -264,15 +282,8 @@ class DataUtils:
 		if not data:
 			return data
 
-		empty_columns = DataUtils.find_empty_columns(data)
-
-		# Create new array without empty columns
-		result = []
-		for row in data:
-			new_row = []
-			for i, cell in enumerate(row):
-				if i not in empty_columns:
-					new_row.append(cell)
-			result.append(new_row)
+		empty_columns = set(DataUtils.find_empty_columns(data))
 
-		return result
+		# Create new array without empty columns, short rows stay short
+		keep = [i not in empty_columns for i in range(max(map(len, data)))]
+		return [list(compress(row, keep)) for row in data]
@@ -2,64 +2,81 @@
 
 import logging
 import re
-from urllib.parse import parse_qs, urlparse
+from functools import lru_cache
+from urllib.parse import unquote, urlparse
 
 logger = logging.getLogger(__name__)
 
+# Patterns locating the sheet ID, tried in order
+_SHEET_ID_PATTERNS = (
+	re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)'),
+	re.compile(r'id=([a-zA-Z0-9-_]+)'),
+	re.compile(r'key=([a-zA-Z0-9-_]+)'),
+)
+
+# Hosts serving Google Sheets documents
+_GOOGLE_HOSTS = frozenset(('docs.google.com', 'drive.google.com'))
+
+# gid parameter in the query string (?gid=) or, as Google Sheets uses in the
+# browser address bar, in the URL fragment (#gid=). The query comes first.
+_GID_PATTERN = re.compile(r'[?&#]gid=([^&#]+)')
+
 
 class URLUtils:
 	"""Utilities for working with Google Sheets URLs."""
 
 	@staticmethod
+	@lru_cache(maxsize=256)
 	def extract_sheet_id(url: str) -> str | None:
 		"""Extracts sheet ID from URL.
 
+		Results are memoized, since the same URL is usually parsed many times.
+
 		Args:
 			url: Google Sheets URL
 
 		Returns:
 			Sheet ID or None
 		"""
-		patterns = [
-			r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-			r'id=([a-zA-Z0-9-_]+)',
-			r'key=([a-zA-Z0-9-_]+)',
-		]
-
-		for pattern in patterns:
-			match = re.search(pattern, url)
+		for pattern in _SHEET_ID_PATTERNS:
+			match = pattern.search(url)
 			if match:
 				return match.group(1)
 
 		return None
 
 	@staticmethod
+	@lru_cache(maxsize=256)
 	def extract_gid(url: str) -> str | None:
 		"""Extracts worksheet GID from URL.
 
+		Results are memoized, since the same URL is usually parsed many times.
+
 		Args:
 			url: Google Sheets URL
 
 		Returns:
 			Worksheet GID or None
 		"""
-		parsed = urlparse(url)
-
-		# gid may live in the query string (?gid=) or, as Google Sheets uses
-		# in the browser address bar, in the URL fragment (#gid=).
-		for part in (parsed.query, parsed.fragment):
-			params = parse_qs(part)
-			if 'gid' in params:
-				return params['gid'][0]
-
-		return None
+		match = _GID_PATTERN.search(url)
+		# Percent-decode the value, as parse_qs did
+		return unquote(match.group(1)) if match else None
 
 	@staticmethod
+	@lru_cache(maxsize=256)
 	def is_google_sheets_url(url: str) -> bool:
-		"""Checks if URL is a Google Sheets URL."""
+		"""Checks if URL is a Google Sheets URL.
+
+		Results are memoized, since the same URL is usually checked many times.
+		"""
+		# The host can only match if its name occurs in the URL, so other
+		# URLs are rejected without parsing
+		if 'docs.google.com' not in url and 'drive.google.com' not in url:
+			return False
+
 		parsed = urlparse(url)
 		return (
-			parsed.netloc in ['docs.google.com', 'drive.google.com']
+			parsed.netloc in _GOOGLE_HOSTS
 			and URLUtils.extract_sheet_id(url) is not None
 		)
 
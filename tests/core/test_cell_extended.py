@@ -2,7 +2,13 @@
 
 import pytest
 
-from src.gsparse.core.cell import Cell
+from src.gsparse.core.cell import (
+	_COL_NUMBERS,
+	MAX_COLUMN,
+	Cell,
+	_column_letter_to_number,
+	_number_to_column_letter,
+)
 
 
 class TestCellExtended:
@@ -25,6 +31,12 @@ class TestCellExtended:
 		assert Cell(1, 703, 'AAA').address == 'AAA1'
 		assert Cell(1, 704, 'AAB').address == 'AAB1'
 
+	def test_cell_address_max_columns(self):
+		"""Test cell address generation around the last Excel column."""
+		assert Cell(1, 16384, 'XFD').address == 'XFD1'
+		assert Cell(1, 16385, 'XFE').address == 'XFE1'
+		assert Cell(1, 18279, 'AAAA').address == 'AAAA1'
+
 	def test_cell_address_large_numbers(self):
 		"""Test cell address generation with large row numbers."""
 		assert Cell(1000, 1, 'A').address == 'A1000'
@@ -105,6 +117,11 @@ class TestCellExtended:
 		assert Cell(1, 1, []).is_empty is False
 		assert Cell(1, 1, {}).is_empty is False
 
+	def test_cell_empty_unicode_whitespace(self):
+		"""Test Unicode whitespace is blank exactly like str.strip() treats it."""
+		for value in ('\u00a0', '\u3000\u2003', '\x1f', ' \u00a0x', '\u200b'):
+			assert Cell(1, 1, value).is_empty is (not value.strip())
+
 	def test_cell_value_types(self):
 		"""Test cell with different value types."""
 		# String
@@ -227,3 +244,32 @@ class TestCellExtended:
 		# repr shows the dataclass representation, not the address
 		assert 'row=1' in cell_repr
 		assert 'column=1' in cell_repr
+
+	def test_cell_bulk_create(self):
+		"""Test creating cells from parallel sequences."""
+		cells = Cell.bulk_create([1, 1, 2], [1, 2, 1], ['A', None, 3])
+
+		assert cells == [Cell(1, 1, 'A'), Cell(1, 2, None), Cell(2, 1, 3)]
+		assert [cell.address for cell in cells] == ['A1', 'B1', 'A2']
+		assert cells[1].is_empty is True
+
+	def test_cell_uses_slots(self):
+		"""Test that cells don't carry a per-instance __dict__."""
+		cell = Cell(1, 1, 'Test')
+		assert not hasattr(cell, '__dict__')
+
+		with pytest.raises(AttributeError):
+			cell.unknown_attribute = 'value'
+
+	def test_column_letter_conversion_round_trip(self):
+		"""Test converting column numbers to letters and back."""
+		for col_num in (1, 26, 27, 702, 703, 16384, 16385, 20000):
+			letters = _number_to_column_letter(col_num)
+			assert _column_letter_to_number(letters) == col_num
+
+	def test_column_number_table(self):
+		"""Test the reverse column table covers every Excel column."""
+		assert len(_COL_NUMBERS) == MAX_COLUMN
+		assert _COL_NUMBERS['A'] == 1
+		assert _COL_NUMBERS['ZZ'] == 702
+		assert _COL_NUMBERS['XFD'] == MAX_COLUMN
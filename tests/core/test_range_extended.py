@@ -218,6 +218,21 @@ class TestRangeExtended:
 		assert range_obj.start_column == 1
 		assert range_obj.end_column == 3
 
+	def test_range_from_address_memoized(self):
+		"""Test repeated cell addresses are parsed once and errors still raise."""
+		Range._parse_cell_address.cache_clear()
+
+		for _ in range(3):
+			assert Range.from_address('B2:B2') == Range(2, 2, 2, 2)
+		for _ in range(2):
+			with pytest.raises(ValueError):
+				Range.from_address('1A')
+
+		# Failed parses are not cached, so each one counts as a miss
+		info = Range._parse_cell_address.cache_info()
+		assert info.misses == 3
+		assert info.hits == 5
+
 	def test_range_from_address_empty(self):
 		"""Test range creation from empty address."""
 		with pytest.raises(ValueError):
@@ -310,3 +325,56 @@ class TestRangeExtended:
 		for row in range(inner_range.start_row, inner_range.end_row + 1):
 			for col in range(inner_range.start_column, inner_range.end_column + 1):
 				assert outer_range.contains_cell(row, col) is True
+
+	def test_range_get_cells(self):
+		"""Test extracting cells from data within the range."""
+		data = [
+			['A1', 'B1', 'C1'],
+			['A2', 'B2', 'C2'],
+			['A3', 'B3'],
+		]
+		range_obj = Range(2, 3, 2, 3)
+
+		cells = range_obj.get_cells(data)
+
+		assert [(cell.row, cell.column, cell.value) for cell in cells] == [
+			(2, 2, 'B2'),
+			(2, 3, 'C2'),
+			(3, 2, 'B3'),
+		]
+		assert cells[0].address == 'B2'
+		assert cells[0].formatted_value is None
+		assert cells[0].formula is None
+
+	def test_range_get_cells_outside_data(self):
+		"""Test extracting cells from a range outside the data."""
+		assert Range(5, 6, 1, 2).get_cells([['A', 'B']]) == []
+
+	def test_range_from_address_lowercase(self):
+		"""Test creating range from lowercase address."""
+		range_obj = Range.from_address('b2:aa10')
+		assert range_obj.start_row == 2
+		assert range_obj.start_column == 2
+		assert range_obj.end_row == 10
+		assert range_obj.end_column == 27
+		assert range_obj.address == 'B2:AA10'
+
+	def test_range_contains_many(self):
+		"""Test checking many cells against the range at once."""
+		range_obj = Range(2, 4, 2, 4)
+		rows = [1, 2, 3, 4, 5, 3]
+		columns = [2, 2, 3, 4, 4, 5]
+
+		assert range_obj.contains_many(rows, columns) == [
+			False,
+			True,
+			True,
+			True,
+			False,
+			False,
+		]
+		assert range_obj.contains_many(rows, columns) == [
+			range_obj.contains_cell(row, col)
+			for row, col in zip(rows, columns, strict=True)
+		]
+		assert range_obj.contains_many([], []) == []
@@ -1,5 +1,7 @@
 """Extended tests for Spreadsheet."""
 
+from unittest.mock import patch
+
 import pytest
 
 from src.gsparse.core.spreadsheet import Spreadsheet
@@ -304,3 +306,99 @@ class TestSpreadsheetExtended:
 		assert spreadsheet.get_worksheet('Sheet1') == worksheet1
 		assert spreadsheet.get_worksheet('Sheet3') == worksheet3
 		assert spreadsheet.get_worksheet('Sheet2') is None
+
+	def test_spreadsheet_add_and_remove_worksheets(self):
+		"""Test that lookups stay correct after adding and removing worksheets."""
+		worksheet1 = Worksheet('Sheet1', [['A', 'B']], 1, 2)
+		worksheet2 = Worksheet('Sheet2', [['1', '2']], 1, 2)
+		worksheet3 = Worksheet('Sheet3', [['X', 'Y']], 1, 2)
+
+		spreadsheet = Spreadsheet('Test', [worksheet1, worksheet2])
+		spreadsheet.add_worksheet(worksheet3)
+
+		assert spreadsheet['Sheet3'] is worksheet3
+		with pytest.raises(ValueError, match="'Sheet3' already exists"):
+			spreadsheet.add_worksheet(Worksheet('Sheet3', [], 0, 0))
+
+		assert spreadsheet.remove_worksheet('Sheet1') is True
+		assert spreadsheet.remove_worksheet('Sheet1') is False
+		assert 'Sheet1' not in spreadsheet
+		assert spreadsheet.get_worksheet('Sheet2') is worksheet2
+		assert spreadsheet.get_worksheet('Sheet3') is worksheet3
+		assert spreadsheet.worksheet_names == ['Sheet2', 'Sheet3']
+
+	def test_spreadsheet_add_worksheet_keeps_index(self):
+		"""Test that adding worksheets updates the index without rebuilding it."""
+		spreadsheet = Spreadsheet('Test', [Worksheet('Sheet0', [], 0, 0)])
+		worksheets = [Worksheet(f'Sheet{i}', [], 0, 0) for i in range(1, 50)]
+
+		with patch.object(Spreadsheet, '_rebuild_name_index') as rebuild:
+			for worksheet in worksheets:
+				spreadsheet.add_worksheet(worksheet)
+			assert 'Missing' not in spreadsheet
+			assert spreadsheet.get_worksheet('Missing') is None
+
+		rebuild.assert_not_called()
+		assert spreadsheet['Sheet49'] is worksheets[-1]
+
+		# Appending to the list directly is still picked up
+		appended = Worksheet('Appended', [], 0, 0)
+		spreadsheet.worksheets.append(appended)
+		assert spreadsheet.get_worksheet('Appended') is appended
+
+	def test_spreadsheet_renamed_worksheet_lookup(self):
+		"""Test lookup of a worksheet renamed after the spreadsheet was created."""
+		worksheet = Worksheet('Sheet1', [['A', 'B']], 1, 2)
+		spreadsheet = Spreadsheet('Test', [worksheet])
+
+		worksheet.name = 'Renamed'
+
+		assert spreadsheet.get_worksheet('Sheet1') is None
+		assert spreadsheet.get_worksheet('Renamed') is worksheet
+
+	def test_spreadsheet_renamed_worksheet_found_by_new_name(self):
+		"""Test a worksheet renamed in place is found by its new name first."""
+		worksheet1 = Worksheet('Sheet1', [['A']], 1, 1)
+		worksheet2 = Worksheet('Sheet2', [['B']], 1, 1)
+		spreadsheet = Spreadsheet('Test', [worksheet1, worksheet2])
+
+		worksheet2.name = 'Renamed'
+
+		assert 'Renamed' in spreadsheet
+		assert spreadsheet.get_worksheet('Renamed') is worksheet2
+		assert spreadsheet['Renamed'] is worksheet2
+		assert spreadsheet.get_worksheet('Sheet2') is None
+		with pytest.raises(ValueError, match="'Renamed' already exists"):
+			spreadsheet.add_worksheet(Worksheet('Renamed', [], 0, 0))
+
+	def test_spreadsheet_data_summary(self):
+		"""Test spreadsheet data summary."""
+		worksheet1 = Worksheet('Sheet1', [['A', None], ['', 2]], 2, 2)
+		worksheet2 = Worksheet('Sheet2', [['X', 'Y', '  ']], 1, 3)
+
+		spreadsheet = Spreadsheet('Test', [worksheet1, worksheet2], url='url')
+		summary = spreadsheet.get_data_summary()
+
+		assert summary == {
+			'title': 'Test',
+			'worksheet_count': 2,
+			'worksheet_names': ['Sheet1', 'Sheet2'],
+			'total_cells': 7,
+			'non_empty_cells': 4,
+			'url': 'url',
+		}
+
+	def test_spreadsheet_cell_iterators(self):
+		"""Test streaming search over all worksheets."""
+		worksheet1 = Worksheet('Sheet1', [['A', 'B'], ['1', '2']], 2, 2)
+		worksheet2 = Worksheet('Sheet2', [['B', 'x1']], 1, 2)
+		spreadsheet = Spreadsheet('Test', [worksheet1, worksheet2])
+
+		assert len(list(spreadsheet.iter_all_cells())) == 6
+
+		first_match = next(spreadsheet.iter_cells_by_value('B'))
+		assert (first_match.row, first_match.column) == (1, 2)
+		assert len(spreadsheet.find_cells_by_value('B')) == 2
+
+		matches = spreadsheet.iter_cells_by_pattern(r'\d')
+		assert [cell.value for cell in matches] == ['1', '2', 'x1']
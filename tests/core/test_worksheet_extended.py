@@ -1,8 +1,12 @@
 """Extended tests for Worksheet."""
 
+import re
+import sys
+
 import pytest
 
-from src.gsparse.core.worksheet import Worksheet
+from src.gsparse.core.range import Range
+from src.gsparse.core.worksheet import _CONTEXT_SYNTAX_RE, Worksheet
 
 
 class TestWorksheetExtended:
@@ -326,6 +330,21 @@ class TestWorksheetExtended:
 		assert rows[1] == ['1']
 		assert rows[2] == ['X', 'Y', 'Z']
 
+	def test_worksheet_equality_checks_dimensions_first(self):
+		"""Test worksheets of different size compare unequal without the data."""
+
+		class Uncomparable(list):
+			def __eq__(self, other):
+				raise AssertionError('data should not be compared')
+
+		worksheet1 = Worksheet('Test', Uncomparable([['A']]), 1, 1)
+		worksheet2 = Worksheet('Test', Uncomparable([['A', 'B']]), 1, 2)
+
+		assert worksheet1 != worksheet2
+		assert worksheet1 != 'Test'
+		with pytest.raises(TypeError):
+			hash(worksheet1)
+
 	def test_worksheet_equality(self):
 		"""Test worksheet equality."""
 		data1 = [['A', 'B'], ['1', '2']]
@@ -405,3 +424,221 @@ class TestWorksheetExtended:
 		assert worksheet.get_cell(2, 2).value == '`~-_=+'
 		assert worksheet.get_cell(3, 1).value == ' \t\n\r '
 		assert worksheet.get_cell(3, 2).value == ''
+
+	def test_iter_cells(self):
+		"""Test lazily iterating over worksheet cells."""
+		worksheet = Worksheet('Test', [['A', None], ['1', '2']], 2, 2)
+
+		cells = worksheet.iter_cells()
+
+		first = next(cells)
+		assert (first.row, first.column, first.value) == (1, 1, 'A')
+		assert [cell.address for cell in cells] == ['B1', 'A2', 'B2']
+		assert worksheet.get_all_cells() == list(worksheet.iter_cells())
+
+	def test_find_cells_by_compiled_pattern(self):
+		"""Test searching cells with a precompiled regular expression."""
+		worksheet = Worksheet('Test', [['abc', 12], [None, 'x3']], 2, 2)
+		pattern = re.compile(r'\d')
+
+		cells = worksheet.find_cells_by_compiled_pattern(pattern)
+
+		assert [cell.address for cell in cells] == ['B1', 'B2']
+		assert cells == worksheet.find_cells_by_pattern(r'\d')
+
+	def test_find_cells_by_value_mixed_types(self):
+		"""Test searching by value in a worksheet with mixed value types."""
+		worksheet = Worksheet('Test', [['1', 1, 1.0], [True, None, '1']], 2, 3)
+
+		assert [cell.address for cell in worksheet.find_cells_by_value('1')] == [
+			'A1',
+			'C2',
+		]
+		assert [cell.address for cell in worksheet.find_cells_by_value(1)] == [
+			'B1',
+			'C1',
+			'A2',
+		]
+		assert [cell.address for cell in worksheet.find_cells_by_value(None)] == ['B2']
+
+	def test_remove_empty_columns_uneven_rows(self):
+		"""Test removing empty columns when rows have different lengths."""
+		data = [['A', None, 'C', 'extra'], ['1', '  '], [None, None, '3']]
+		worksheet = Worksheet('Test', data, 3, 3)
+
+		cleaned = worksheet.remove_empty_columns()
+
+		# Values past column_count are kept as before
+		assert cleaned.data == [['A', 'C', 'extra'], ['1'], [None, '3']]
+		assert worksheet.get_columns() == [
+			['A', '1', None],
+			[None, '  ', None],
+			['C', None, '3'],
+		]
+
+		worksheet.remove_empty_columns_inplace()
+		assert worksheet.data == cleaned.data
+		assert worksheet.column_count == 3
+
+	def test_accessors_match_get_cell(self):
+		"""Test row, column and range accessors return the same cells as get_cell."""
+		data = [['A', 'B', 'C'], [1, None, 3], ['x', 'y', 'z']]
+		worksheet = Worksheet('Test', data, 3, 3)
+
+		assert worksheet.get_row(2) == [worksheet.get_cell(2, c) for c in (1, 2, 3)]
+		assert worksheet.get_column(3) == [worksheet.get_cell(r, 3) for r in (1, 2, 3)]
+
+		# Range partly outside the worksheet is clipped
+		cells = worksheet.get_cells_in_range(Range(2, 5, 2, 4))
+		assert [cell.address for cell in cells] == ['B2', 'C2', 'B3', 'C3']
+		assert cells == [worksheet.get_cell(c.row, c.column) for c in cells]
+
+	def test_clean_data_matches_two_step_cleaning(self):
+		"""Test clean_data gives the same result as removing rows then columns."""
+		data = [
+			[None, '', None, None],
+			['A', None, ' ', 'D'],
+			[None, None, None, None],
+			[1, None, None],
+			['  ', None, None, 0],
+		]
+		worksheet = Worksheet('Test', data, 5, 4)
+		expected = worksheet.remove_empty_rows().remove_empty_columns()
+
+		cleaned = worksheet.clean_data()
+
+		assert cleaned == expected
+		assert cleaned.data == [['A', 'D'], [1, None], ['  ', 0]]
+
+		worksheet.clean_data_inplace()
+		assert worksheet == expected
+
+	def test_remove_empty_rows_keeps_falsy_values(self):
+		"""Test zero and False count as values when removing empty rows."""
+		data = [[0, None], [None, ' \n'], [None, False]]
+		worksheet = Worksheet('Test', data, 3, 2)
+
+		assert worksheet.remove_empty_rows().data == [[0, None], [None, False]]
+		assert worksheet.remove_empty_columns().data == data
+
+	def test_cells_reflect_data_changes(self):
+		"""Test cell listings are rebuilt from current data on every call."""
+		worksheet = Worksheet('Test', [['A', 'B'], ['C', 'D']], 2, 2)
+
+		assert [cell.value for cell in worksheet] == ['A', 'B', 'C', 'D']
+
+		worksheet.data[1][0] = 'X'
+
+		assert [cell.value for cell in worksheet.get_all_cells()] == [
+			'A',
+			'B',
+			'X',
+			'D',
+		]
+		assert list(worksheet) == worksheet.get_all_cells()
+
+	def test_find_cells_by_pattern_matches_per_cell_search(self):
+		"""Test pattern search gives the same cells as searching every value."""
+		data = [
+			['abc', 'def', None],
+			[12, 3.5, 'x1'],
+			['', 0, 'end'],
+			['start', 'a b', False],
+		]
+		worksheet = Worksheet('Test', data, 4, 3)
+
+		for pattern in [r'\d', r'c.d', r'^e', r'c$', r'\bb', r'a(?= )', 'None', 'x']:
+			expected = [
+				(row, col)
+				for row, row_data in enumerate(data, 1)
+				for col, value in enumerate(row_data, 1)
+				if value and re.search(pattern, str(value))
+			]
+			cells = worksheet.find_cells_by_pattern(pattern)
+			assert [(cell.row, cell.column) for cell in cells] == expected, pattern
+
+	def test_context_syntax_detects_end_anchor_alias(self):
+		"""Test \\z is treated as an anchor on every Python version."""
+		assert _CONTEXT_SYNTAX_RE.search(r'abc\z') is not None
+		assert _CONTEXT_SYNTAX_RE.search(r'abc\d') is None
+
+	@pytest.mark.skipif(
+		sys.version_info < (3, 14), reason='\\z was added in Python 3.14'
+	)
+	def test_find_cells_by_pattern_end_anchor_alias(self):
+		"""Test the \\z anchor is matched against each cell, not the joined row."""
+		worksheet = Worksheet('Test', [['abc', 'x'], ['y', 'abc']], 2, 2)
+
+		cells = worksheet.find_cells_by_pattern(r'abc\z')
+		assert [cell.address for cell in cells] == ['A1', 'B2']
+
+	def test_worksheet_uses_slots(self):
+		"""Test that worksheets don't carry a per-instance __dict__."""
+		worksheet = Worksheet('Test', [['A']], 1, 1)
+		assert not hasattr(worksheet, '__dict__')
+
+		with pytest.raises(AttributeError):
+			worksheet.unknown_attribute = 'value'
+
+	def test_iter_row_and_column(self):
+		"""Test lazy row and column iteration."""
+		worksheet = Worksheet('Test', [['A', 'B'], ['C', 'D'], ['E', 'F']], 3, 2)
+
+		assert list(worksheet.iter_row(2)) == worksheet.get_row(2)
+		assert list(worksheet.iter_column(2)) == worksheet.get_column(2)
+		assert list(worksheet.iter_row(4)) == []
+		assert list(worksheet.iter_column(0)) == []
+
+		# Consuming a prefix does not touch the remaining rows
+		column = worksheet.iter_column(1)
+		assert next(column).value == 'A'
+		worksheet.data[2][0] = 'Z'
+		assert [cell.value for cell in column] == ['C', 'Z']
+
+	def test_iter_columns(self):
+		"""Test lazy column value iteration."""
+		worksheet = Worksheet('Test', [['A', 'B'], ['C']], 2, 3)
+
+		columns = worksheet.iter_columns()
+		assert next(columns) == ('A', 'C')
+		assert list(columns) == [('B', None), (None, None)]
+		assert list(Worksheet('Empty', [], 0, 0).iter_columns()) == []
+		assert worksheet.get_columns() == [['A', 'C'], ['B', None], [None, None]]
+
+	def test_remove_empty_rows_pads_rows(self):
+		"""Test removing empty rows pads the remaining rows to one length."""
+		data = [['A'], [None, None, None], ['B', 'C'], ['  ']]
+		worksheet = Worksheet('Test', data, 4, 3)
+
+		cleaned = worksheet.remove_empty_rows()
+
+		assert cleaned.data == [['A', None], ['B', 'C']]
+		assert (cleaned.row_count, cleaned.column_count) == (2, 2)
+		# The new worksheet does not share rows with the original
+		assert cleaned.data[1] is not data[2]
+
+		worksheet.remove_empty_rows_inplace()
+		assert worksheet == cleaned
+
+	def test_remove_empty_columns_keeps_column_order(self):
+		"""Test contiguous and scattered kept columns are copied correctly."""
+		leading = Worksheet('Test', [[None, 'A', 'B', None], [None, 1, 2, '']], 2, 4)
+		scattered = Worksheet('Test', [['A', None, 'B', None, 'C']], 1, 5)
+
+		assert leading.remove_empty_columns().data == [['A', 'B'], [1, 2]]
+		assert scattered.remove_empty_columns().data == [['A', 'B', 'C']]
+		assert leading.remove_empty_columns().data[0] is not leading.data[0]
+
+	def test_get_data_as_dict_short_rows(self):
+		"""Test dictionaries from rows shorter than the header row."""
+		contiguous = Worksheet('Test', [['A', 'B', 'C'], [1, 2, 3], [4]], 3, 3)
+		with_gap = Worksheet('Test', [['A', None, 'C'], [1, 2, 3], [4]], 3, 3)
+
+		assert contiguous.get_data_as_dict() == [
+			{'A': 1, 'B': 2, 'C': 3},
+			{'A': 4, 'B': None, 'C': None},
+		]
+		assert with_gap.get_data_as_dict() == [
+			{'A': 1, 'C': 3},
+			{'A': 4, 'C': None},
+		]
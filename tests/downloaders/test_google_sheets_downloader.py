@@ -4,7 +4,11 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from src.gsparse.downloaders.google_sheets_downloader import GoogleSheetsDownloader
+from src.gsparse.downloaders.google_sheets_downloader import (
+	POOL_MAXSIZE,
+	GoogleSheetsDownloader,
+)
+from src.gsparse.utils.url_utils import URLUtils
 
 
 class TestGoogleSheetsDownloader:
@@ -22,6 +26,35 @@ class TestGoogleSheetsDownloader:
 		assert downloader.timeout == 60
 		assert downloader.session is not None
 
+	def test_downloaders_share_connection_pool(self):
+		"""Test downloaders with the same retry settings share an HTTP adapter."""
+		first = GoogleSheetsDownloader()
+		second = GoogleSheetsDownloader(timeout=10)
+		other = GoogleSheetsDownloader(max_retries=5)
+
+		adapter = first.session.get_adapter('https://docs.google.com')
+
+		assert first.session is not second.session
+		assert second.session.get_adapter('https://docs.google.com') is adapter
+		assert other.session.get_adapter('https://docs.google.com') is not adapter
+		assert other.session.get_adapter('https://x').max_retries.total == 5
+		# Room for concurrent downloads on the shared connection pool
+		assert adapter._pool_maxsize == POOL_MAXSIZE
+
+	def test_close_keeps_shared_connection_pools(self):
+		"""Test closing one downloader leaves the shared pools to the others."""
+		first = GoogleSheetsDownloader()
+		second = GoogleSheetsDownloader()
+		adapter = second.session.get_adapter('https://docs.google.com')
+		pool = adapter.poolmanager.connection_from_url('https://docs.google.com')
+
+		first.close()
+		first.session.close()
+
+		assert (
+			adapter.poolmanager.connection_from_url('https://docs.google.com') is pool
+		)
+
 	def test_extract_sheet_id_standard_url(self):
 		"""Test extracting sheet ID from standard Google Sheets URL."""
 		downloader = GoogleSheetsDownloader()
@@ -88,6 +121,22 @@ class TestGoogleSheetsDownloader:
 		url = 'https://docs.google.com/spreadsheets/'
 		assert downloader.is_valid_google_sheets_url(url) is False
 
+	def test_is_valid_google_sheets_url_matches_url_utils(self):
+		"""Test downloader validation agrees with URLUtils for various URLs."""
+		downloader = GoogleSheetsDownloader()
+		urls = [
+			'https://docs.google.com/spreadsheets/d/abc123/edit#gid=0',
+			'https://drive.google.com/open?id=abc123',
+			'https://example.com/spreadsheets/d/abc123',
+			'https://docs.google.com/spreadsheets/',
+		]
+
+		for url in urls:
+			assert downloader.is_valid_google_sheets_url(
+				url
+			) == URLUtils.is_google_sheets_url(url)
+			assert downloader.extract_sheet_id(url) == URLUtils.extract_sheet_id(url)
+
 	def test_get_export_url_csv(self):
 		"""Test getting export URL for CSV format."""
 		downloader = GoogleSheetsDownloader()
@@ -210,6 +259,35 @@ class TestGoogleSheetsDownloader:
 		with pytest.raises(Exception, match='Network error'):
 			downloader.download_sheet(url, 'csv')
 
+	def test_stream_sheet(self):
+		"""Test streaming sheet download in chunks."""
+		mock_response = Mock()
+		mock_response.__enter__ = Mock(return_value=mock_response)
+		mock_response.__exit__ = Mock(return_value=False)
+		mock_response.raise_for_status.return_value = None
+		mock_response.iter_content.return_value = iter([b'a,b\n', b'1,2\n'])
+
+		downloader = GoogleSheetsDownloader()
+		downloader.session.get = Mock(return_value=mock_response)
+
+		url = 'https://docs.google.com/spreadsheets/d/test_sheet_id/edit'
+		chunks = list(downloader.stream_sheet(url, 'csv', chunk_size=4))
+
+		assert chunks == [b'a,b\n', b'1,2\n']
+		downloader.session.get.assert_called_once_with(
+			downloader.get_export_url('test_sheet_id', 'csv'), timeout=30, stream=True
+		)
+		mock_response.iter_content.assert_called_once_with(4)
+
+	def test_stream_sheet_invalid_url(self):
+		"""Test streaming validates the URL before any request is made."""
+		downloader = GoogleSheetsDownloader()
+		downloader.session.get = Mock()
+
+		with pytest.raises(ValueError, match='Invalid Google Sheets URL'):
+			downloader.stream_sheet('https://example.com/not-a-sheet')
+		downloader.session.get.assert_not_called()
+
 	def test_get_sheet_info_success(self):
 		"""Test getting sheet information."""
 		downloader = GoogleSheetsDownloader()
@@ -1,7 +1,10 @@
 """Tests for BaseParser."""
 
+from unittest.mock import patch
+
 from src.gsparse.core.spreadsheet import Spreadsheet
 from src.gsparse.core.worksheet import Worksheet
+from src.gsparse.parsers import base_parser
 from src.gsparse.parsers.base_parser import BaseParser
 
 
@@ -129,3 +132,107 @@ class TestBaseParser:
 		assert parser._clean_cell_value(3.1) == '3.1'
 		assert parser._clean_cell_value(28.1) == '28.1'
 		assert parser._clean_cell_value(42) == '42'
+
+	def test_detect_encoding_fast_paths(self):
+		"""Test BOMs and UTF-8 data are recognized without the charset detector."""
+		parser = ConcreteParser()
+		text = 'Имя,Город\nИван,Москва\n'
+
+		with patch.object(base_parser._charset_detector, 'detect') as detect:
+			assert parser._detect_encoding(b'\xef\xbb\xbfa,b') == 'utf-8-sig'
+			assert parser._detect_encoding('a,b'.encode('utf-16')) == 'utf-16'
+			assert parser._detect_encoding(text.encode('utf-8')) == 'utf-8'
+			# Multi-byte character cut by the sample boundary is still UTF-8
+			data = ('a' * 4095 + 'Ж').encode('utf-8')
+			assert parser._detect_encoding(data, sample_size=4096) == 'utf-8'
+		detect.assert_not_called()
+
+	def test_detect_encoding_falls_back_to_detector(self):
+		"""Test non-UTF-8 data is passed to the charset detector."""
+		parser = ConcreteParser()
+		data = ('Имя,Город\nИван,Москва\n' * 5).encode('cp1251')
+		base_parser._detect_encoding_cached.cache_clear()
+
+		with patch.object(
+			base_parser._charset_detector,
+			'detect',
+			return_value={'encoding': 'windows-1251', 'confidence': 0.9},
+		) as detect:
+			assert parser._detect_encoding(data) == 'windows-1251'
+		detect.assert_called_once_with(data)
+		base_parser._detect_encoding_cached.cache_clear()
+
+	def test_detect_encoding_is_memoized(self):
+		"""Test repeated payloads run the charset detector only once."""
+		parser = ConcreteParser()
+		data = ('Имя,Город\nИван,Москва\n' * 5).encode('cp1251')
+		base_parser._detect_encoding_cached.cache_clear()
+
+		with patch.object(
+			base_parser._charset_detector,
+			'detect',
+			return_value={'encoding': 'windows-1251', 'confidence': 0.9},
+		) as detect:
+			for _ in range(3):
+				assert parser._detect_encoding(data) == 'windows-1251'
+			# Only the sample is part of the cache key
+			assert parser._detect_encoding(data + b'\xcf', len(data)) == (
+				'windows-1251'
+			)
+		detect.assert_called_once_with(data)
+		base_parser._detect_encoding_cached.cache_clear()
+
+	def test_clean_rows_matches_clean_cell_value(self):
+		"""Test batch cleaning gives the same values as cleaning every cell."""
+		rows = [['  a ', '', None, 1.5], ['b\r\nc', '   ', 0, True]]
+
+		for preserve_strings in (False, True):
+			parser = ConcreteParser(preserve_strings=preserve_strings)
+			expected = [[parser._clean_cell_value(v) for v in row] for row in rows]
+
+			assert parser._clean_rows(rows) == expected
+			# Fast path is only valid without carriage returns
+			assert parser._clean_rows(rows[:1], line_breaks=False) == expected[:1]
+
+	def test_pad_rows(self):
+		"""Test rows are padded in place to the longest row."""
+		rows = [['a'], ['b', 'c', 'd'], []]
+		first = rows[0]
+
+		assert BaseParser._pad_rows(rows) == 3
+		assert rows == [['a', None, None], ['b', 'c', 'd'], [None, None, None]]
+		assert rows[0] is first
+		assert BaseParser._pad_rows([]) == 0
+
+	def test_detect_encoding_non_utf8(self):
+		"""Test Cyrillic CP1251 data is detected and decodes correctly."""
+		parser = ConcreteParser()
+		text = 'Имя,Город\nИван,Москва\nПётр,Санкт-Петербург\n' * 5
+		data = text.encode('cp1251')
+
+		assert data.decode(parser._detect_encoding(data)) == text
+
+	def test_detect_encoding_short_sample_skips_detector(self):
+		"""Test short non-UTF-8 samples are left to the fallback encodings."""
+		parser = ConcreteParser()
+		base_parser._detect_encoding_cached.cache_clear()
+
+		with patch.object(base_parser._charset_detector, 'detect') as detect:
+			assert parser._detect_encoding('id,name\n1,Ёж\n'.encode('cp1251')) == (
+				'utf-8'
+			)
+		detect.assert_not_called()
+		base_parser._detect_encoding_cached.cache_clear()
+
+	def test_detect_encoding_undetectable_data(self):
+		"""Test data the detector cannot identify falls back to UTF-8."""
+		parser = ConcreteParser()
+		base_parser._detect_encoding_cached.cache_clear()
+
+		with patch.object(
+			base_parser._charset_detector,
+			'detect',
+			return_value={'encoding': None, 'confidence': None},
+		):
+			assert parser._detect_encoding(b'\xff\x00\xfe\x81') == 'utf-8'
+		base_parser._detect_encoding_cached.cache_clear()
@@ -1,5 +1,7 @@
 """Tests for CSVParser."""
 
+from unittest.mock import patch
+
 import pytest
 
 from src.gsparse.core.spreadsheet import Spreadsheet
@@ -152,6 +154,20 @@ class TestCSVParser:
 		assert spreadsheet.worksheet_count == 2
 		assert spreadsheet.worksheet_names == ['Sheet1', 'Sheet2']
 
+	def test_parse_multiple_csv_in_processes(self):
+		"""Test parse_multiple with worker processes keeps results and order."""
+		data_dict = {
+			'Sheet1': b'Name,Age\nJohn,25\nMary,30',
+			'Sheet2': b'City,Country\nMoscow,Russia',
+			'Sheet3': 'Имя;Город\nИван;Москва'.encode('cp1251'),
+		}
+
+		expected = CSVParser().parse_multiple(data_dict)
+		spreadsheet = CSVParser(max_workers=2).parse_multiple(data_dict)
+
+		assert spreadsheet == expected
+		assert spreadsheet.worksheet_names == ['Sheet1', 'Sheet2', 'Sheet3']
+
 	def test_parse_multiple_empty(self):
 		"""Test parsing empty dictionary."""
 		parser = CSVParser()
@@ -192,6 +208,13 @@ class TestCSVParser:
 		delimiter = parser.detect_delimiter(csv_data)
 		assert delimiter == '|'
 
+	def test_detect_delimiter_decodes_only_sample(self):
+		"""Test delimiter detection tolerates a character cut by the sample."""
+		parser = CSVParser(sample_size=10)
+		csv_data = 'Имя;Город\nИван;Москва\n'.encode()
+
+		assert parser.detect_delimiter(csv_data) == ';'
+
 	def test_detect_delimiter_empty_data(self):
 		"""Test delimiter detection with empty data."""
 		parser = CSVParser()
@@ -238,3 +261,50 @@ class TestCSVParser:
 		assert worksheet.get_cell(2, 2).value is None
 		assert worksheet.get_cell(3, 1).value is None
 		assert worksheet.get_cell(4, 3).value is None
+
+	def test_csv_parser_encoding_sample_size(self):
+		"""Test encoding detection only examines the configured sample."""
+		parser = CSVParser(sample_size=8)
+		data = 'a,b\n1,2\nПривет,мир\n'.encode('cp1251')
+
+		with patch.object(
+			parser, '_detect_encoding', wraps=parser._detect_encoding
+		) as detect:
+			worksheet = parser.parse(data)
+
+		detect.assert_called_once_with(data, 8)
+		# The UTF-8 guess from the short sample fails to decode and the
+		# parser falls back to other encodings
+		assert worksheet.get_cell(3, 1).value == 'Привет'
+		assert CSVParser().sample_size == 64 * 1024
+
+	def test_parse_csv_decode_error_after_first_lines(self):
+		"""Test a decoding error late in the stream retries with fallbacks."""
+		parser = CSVParser(encoding='utf-8')
+		data = ('a,b\n' * 10 + 'Привет,мир\n').encode('cp1251')
+
+		worksheet = parser.parse(data)
+
+		assert worksheet.row_count == 11
+		assert worksheet.get_cell(11, 1).value == 'Привет'
+		assert worksheet.get_cell(11, 2).value == 'мир'
+
+	def test_parse_short_cp1251(self):
+		"""Test short CP1251 data is not decoded with a wrong detector guess."""
+		parser = CSVParser()
+
+		worksheet = parser.parse('id,name\n1,Ёж\n'.encode('cp1251'))
+		assert worksheet.data == [['id', 'name'], ['1', 'Ёж']]
+		worksheet = parser.parse('Привет\n'.encode('cp1251'))
+		assert worksheet.data == [['Привет']]
+
+	def test_parse_csv_fallback_skips_failed_encoding(self):
+		"""Test the encoding that already failed is not tried again."""
+		parser = CSVParser(encoding='UTF8')
+		data = 'Привет,мир\n'.encode('cp1251')
+
+		with patch.object(parser, '_read_rows', wraps=parser._read_rows) as read:
+			worksheet = parser.parse(data)
+
+		assert [call.args[1] for call in read.call_args_list] == ['UTF8', 'cp1251']
+		assert worksheet.get_cell(1, 2).value == 'мир'
@@ -304,3 +304,122 @@ class TestXLSXParser:
 		assert worksheet.get_cell(2, 2).value is None
 		assert worksheet.get_cell(3, 1).value is None
 		assert worksheet.get_cell(3, 3).value is None
+
+	def test_parser_backend_selection(self):
+		"""Test XLSX backend validation."""
+		# calamine is opt-in, so output doesn't depend on installed packages
+		assert XLSXParser().backend == 'openpyxl'
+		assert XLSXParser(data_only=False).backend == 'openpyxl'
+		assert XLSXParser(backend='openpyxl').backend == 'openpyxl'
+
+		with pytest.raises(ValueError, match='Unknown XLSX backend'):
+			XLSXParser(backend='xlrd')
+
+	def test_parse_workbook_calamine_matches_openpyxl(self):
+		"""Test calamine backend returns the same data as openpyxl."""
+		pytest.importorskip('python_calamine')
+		from datetime import datetime
+
+		from openpyxl import Workbook
+
+		workbook = Workbook()
+		sheet = workbook.active
+		sheet.title = 'Data'
+		sheet['A1'] = 'Name'
+		sheet['B1'] = 'Score'
+		sheet['C1'] = 'Date'
+		sheet['A2'] = '  John  '
+		sheet['B2'] = 25
+		sheet['C2'] = datetime(2024, 1, 2)
+		sheet['B3'] = 2.5
+		sheet['D4'] = True
+		workbook.create_sheet('Empty')
+		buffer = io.BytesIO()
+		workbook.save(buffer)
+		xlsx_data = buffer.getvalue()
+
+		expected = XLSXParser(backend='openpyxl').parse_workbook(xlsx_data)
+		spreadsheet = XLSXParser(backend='calamine').parse_workbook(xlsx_data)
+
+		assert spreadsheet == expected
+		assert spreadsheet.worksheet_names == ['Data', 'Empty']
+		data = spreadsheet.get_worksheet('Data')
+		assert data.row_count == 4
+		assert data.column_count == 4
+		assert data.data[1] == ['John', 25, datetime(2024, 1, 2), None]
+		assert type(data.data[1][1]) is int
+
+	def test_calamine_integral_float_cells(self):
+		"""Test the documented difference for float cells holding whole numbers."""
+		pytest.importorskip('python_calamine')
+		import zipfile
+
+		from openpyxl import Workbook
+
+		workbook = Workbook()
+		workbook.active['A1'] = 1.0
+		buffer = io.BytesIO()
+		workbook.save(buffer)
+
+		# openpyxl writes 1.0 as 1, so store the value as a real float cell
+		source = zipfile.ZipFile(io.BytesIO(buffer.getvalue()))
+		patched = io.BytesIO()
+		with zipfile.ZipFile(patched, 'w') as target:
+			for item in source.infolist():
+				content = source.read(item)
+				if item.filename == 'xl/worksheets/sheet1.xml':
+					content = content.replace(b'<v>1</v>', b'<v>1.0</v>')
+				target.writestr(item, content)
+		xlsx_data = patched.getvalue()
+
+		openpyxl_value = XLSXParser().parse(xlsx_data, 'Sheet').data[0][0]
+		calamine_value = (
+			XLSXParser(backend='calamine').parse(xlsx_data, 'Sheet').data[0][0]
+		)
+		assert type(openpyxl_value) is float
+		assert type(calamine_value) is int
+		assert calamine_value == openpyxl_value == 1
+
+	@pytest.mark.parametrize('backend', ['openpyxl', 'calamine'])
+	def test_parse_unknown_worksheet_uses_active(self, backend):
+		"""Test both backends read the active worksheet for unknown names."""
+		if backend == 'calamine':
+			pytest.importorskip('python_calamine')
+		from openpyxl import Workbook
+
+		workbook = Workbook()
+		workbook.active.title = 'First'
+		workbook.active['A1'] = 'first'
+		workbook.create_sheet('Second')['A1'] = 'second'
+		workbook.active = 1
+		buffer = io.BytesIO()
+		workbook.save(buffer)
+
+		worksheet = XLSXParser(backend=backend).parse(buffer.getvalue(), 'Missing')
+		assert worksheet.name == 'Second'
+		assert worksheet.data == [['second']]
+
+	def test_parse_calamine_matches_openpyxl(self):
+		"""Test calamine backend parses a single worksheet like openpyxl."""
+		pytest.importorskip('python_calamine')
+		from openpyxl import Workbook
+
+		workbook = Workbook()
+		workbook.active.title = 'First'
+		workbook.active['A1'] = 'x'
+		sheet = workbook.create_sheet('Data')
+		sheet['A1'] = ' Name '
+		sheet['B2'] = 3.0
+		buffer = io.BytesIO()
+		workbook.save(buffer)
+		xlsx_data = buffer.getvalue()
+
+		openpyxl_parser = XLSXParser(backend='openpyxl')
+		calamine_parser = XLSXParser(backend='calamine')
+
+		worksheet = calamine_parser.parse(xlsx_data, 'Data')
+		assert worksheet == openpyxl_parser.parse(xlsx_data, 'Data')
+		assert worksheet.data == [['Name', None], [None, 3]]
+
+		with pytest.raises(ValueError, match='Failed to parse XLSX data'):
+			calamine_parser.parse(b'not an xlsx file')
@@ -1,6 +1,12 @@
 """Extended tests for GSParseClient."""
 
+import pickle
+from unittest.mock import Mock, patch
+
+import pytest
+
 from src.gsparse import GSParseClient
+from src.gsparse.core.spreadsheet import Spreadsheet
 from src.gsparse.core.worksheet import Worksheet
 
 
@@ -152,6 +158,33 @@ Mary,30,St. Petersburg"""
 		assert worksheet.row_count == 3
 		assert worksheet.get_cell(2, 2).value == 'Line 1\nLine 2'
 
+	def test_load_from_csv_string_reuses_parsers(self):
+		"""Test CSV parsers are created once per detected delimiter."""
+		client = GSParseClient()
+
+		first = client.load_from_csv_string('a;b\n1;2', 'First')
+		second = client.load_from_csv_string('c;d\n3;4', 'Second')
+		client.load_from_csv_string('e,f\n5,6', 'Third')
+
+		assert first.get_cell(2, 2).value == '2'
+		assert second.get_cell(2, 1).value == '3'
+		assert sorted(client._parsers) == [',', ';']
+
+	def test_load_from_csv_string_long_lines(self):
+		"""Test delimiter detection when leading lines exceed the sample."""
+		client = GSParseClient()
+
+		# Only the commas of the first line fit the sample, semicolons follow it
+		header = 'a,b,c' + ' ' * 5000
+		csv_data = '\n'.join([header] + ['1;2;3;4'] * 4 + ['a,b,c,d,e,f,g'] * 100)
+
+		sample = client._csv_sample(csv_data)
+		worksheet = client.load_from_csv_string(csv_data, 'Long')
+
+		assert sample == '\n'.join([header] + ['1;2;3;4'] * 4)
+		assert client._csv_sample('a,b\n1,2') == 'a,b\n1,2'
+		assert worksheet.get_cell(2, 3).value == '3'
+
 	def test_load_from_csv_string_with_tabs(self):
 		"""Test loading from CSV string with tab delimiter."""
 		client = GSParseClient()
@@ -419,3 +452,185 @@ Mary,30,St. Petersburg"""
 		assert worksheet.get_cell(3, 4).value == '92.0'
 		assert worksheet.get_cell(4, 2).value is None
 		assert worksheet.get_cell(4, 4).value is None
+
+	def test_load_spreadsheet_csv_downloads_all_worksheets(self, caplog):
+		"""Test loading every worksheet in CSV mode, skipping failed ones."""
+		client = GSParseClient()
+		url = 'https://docs.google.com/spreadsheets/d/test_id/edit'
+		worksheets_info = {'First': '0', 'Broken': '1', 'Third': '2'}
+
+		def download_sheet(url, format_type='csv', gid=None):
+			if format_type == 'xlsx' or gid == '1':
+				raise Exception('Network error')
+			return f'Name\nSheet {gid}'.encode()
+
+		with (
+			patch.object(client.downloader, 'download_sheet', download_sheet),
+			patch.object(
+				client.downloader, 'list_worksheets', return_value=worksheets_info
+			),
+		):
+			spreadsheet = client.load_spreadsheet(url)
+
+		assert spreadsheet.worksheet_names == ['First', 'Third']
+		assert spreadsheet['First'].get_cell(2, 1).value == 'Sheet 0'
+		assert spreadsheet['Third'].get_cell(2, 1).value == 'Sheet 2'
+		assert spreadsheet.url == url
+		assert "Failed to load worksheet 'Broken': Network error" in caplog.text
+
+	def test_load_spreadsheet_cache(self):
+		"""Test that repeated loads of the same URL reuse the spreadsheet."""
+		client = GSParseClient(cache_size=16)
+		url = 'https://docs.google.com/spreadsheets/d/test_id/edit'
+		fetch = Mock(
+			side_effect=lambda url, format_type: Spreadsheet(
+				'Test', [Worksheet('Sheet1', [['A']], 1, 1)], url=url
+			)
+		)
+
+		with patch.object(client, '_fetch_spreadsheet', fetch):
+			first = client.load_spreadsheet(url)
+			assert client.load_spreadsheet(url) is first
+			assert client.find_data(url, 'A')[0].value == 'A'
+			assert fetch.call_count == 1
+
+			assert client.load_spreadsheet(url, cache=False) is not first
+			assert fetch.call_count == 2
+
+			client.invalidate(url)
+			assert client.load_spreadsheet(url) is not first
+			assert fetch.call_count == 3
+
+	def test_load_spreadsheet_not_cached_by_default(self):
+		"""Test that caching is opt-in, so callers never share a spreadsheet."""
+		client = GSParseClient()
+		url = 'https://docs.google.com/spreadsheets/d/test_id/edit'
+		fetch = Mock(
+			side_effect=lambda url, format_type: Spreadsheet(
+				'Test', [Worksheet('Sheet1', [['A']], 1, 1)], url=url
+			)
+		)
+
+		with patch.object(client, '_fetch_spreadsheet', fetch):
+			first = client.load_spreadsheet(url)
+			first['Sheet1'].data[0][0] = 'Changed'
+			assert client.load_spreadsheet(url)['Sheet1'].data == [['A']]
+			assert fetch.call_count == 2
+
+	def test_load_spreadsheet_cache_limits(self):
+		"""Test cache expiry and size limit."""
+		urls = [f'https://docs.google.com/spreadsheets/d/id{i}/edit' for i in range(3)]
+		fetch = Mock(
+			side_effect=lambda url, format_type: Spreadsheet(
+				'Test', [Worksheet('Sheet1', [['A']], 1, 1)], url=url
+			)
+		)
+
+		client = GSParseClient(cache_size=2)
+		with patch.object(client, '_fetch_spreadsheet', fetch):
+			for url in urls:
+				client.load_spreadsheet(url)
+			client.load_spreadsheet(urls[0])
+			assert fetch.call_count == 4
+
+		client = GSParseClient(cache_ttl=-1, cache_size=2)
+		with patch.object(client, '_fetch_spreadsheet', fetch):
+			client.load_spreadsheet(urls[0])
+			client.load_spreadsheet(urls[0])
+			assert fetch.call_count == 6
+
+	def test_load_spreadsheet_format_dispatch(self):
+		"""Test that XLSX is tried first and CSV is only used when needed."""
+		client = GSParseClient(cache_size=0)
+		url = 'https://docs.google.com/spreadsheets/d/test_id/edit'
+		spreadsheet = Spreadsheet('Test', [Worksheet('Sheet1', [['A']], 1, 1)])
+
+		with (
+			patch.object(client, '_load_xlsx', return_value=spreadsheet) as load_xlsx,
+			patch.object(client, '_load_csv', return_value=spreadsheet) as load_csv,
+		):
+			assert client.load_spreadsheet(url) is spreadsheet
+			assert load_xlsx.call_count == 1
+			assert load_csv.call_count == 0
+
+			with pytest.warns(DeprecationWarning, match='CSV format is deprecated'):
+				client.load_spreadsheet(url, 'csv')
+			assert load_xlsx.call_count == 1
+			assert load_csv.call_count == 1
+
+			load_xlsx.side_effect = Exception('Network error')
+			assert client.load_spreadsheet(url) is spreadsheet
+			assert load_csv.call_count == 2
+
+	def test_load_spreadsheet_disk_cache(self, tmp_path):
+		"""Test that parsed workbooks are reused from the cache directory."""
+		url = 'https://docs.google.com/spreadsheets/d/test_id/edit'
+		spreadsheet = Spreadsheet('Test', [Worksheet('Sheet1', [['A', 1]], 1, 2)])
+
+		first_client = GSParseClient(cache_dir=tmp_path)
+		with (
+			patch.object(first_client.downloader, 'download_sheet', return_value=b'v1'),
+			patch.object(
+				first_client.xlsx_parser, 'parse_workbook', return_value=spreadsheet
+			) as parse_workbook,
+		):
+			first_client.load_spreadsheet(url)
+		assert parse_workbook.call_count == 1
+		assert len(list(tmp_path.glob('*.pickle'))) == 1
+
+		second_client = GSParseClient(cache_dir=tmp_path)
+		with (
+			patch.object(
+				second_client.downloader, 'download_sheet', return_value=b'v1'
+			),
+			patch.object(second_client.xlsx_parser, 'parse_workbook') as parse_workbook,
+		):
+			loaded = second_client.load_spreadsheet(url)
+		assert parse_workbook.call_count == 0
+		assert loaded == spreadsheet
+		assert loaded.url == url
+
+		# Changed content must not be served from the cache
+		with (
+			patch.object(
+				second_client.downloader, 'download_sheet', return_value=b'v2'
+			),
+			patch.object(
+				second_client.xlsx_parser, 'parse_workbook', return_value=spreadsheet
+			) as parse_workbook,
+		):
+			second_client.load_spreadsheet(url, cache=False)
+		assert parse_workbook.call_count == 1
+
+	def test_disk_cache_keyed_on_parser_settings(self, tmp_path):
+		"""Test that cache files are not shared between XLSX backends."""
+		spreadsheet = Spreadsheet('Test', [Worksheet('Sheet1', [['A', 1]], 1, 2)])
+
+		for backend in ('openpyxl', 'calamine'):
+			client = GSParseClient(cache_dir=tmp_path)
+			client.xlsx_parser.backend = backend
+			with patch.object(
+				client.xlsx_parser, 'parse_workbook', return_value=spreadsheet
+			) as parse_workbook:
+				client._parse_workbook(b'v1')
+			assert parse_workbook.call_count == 1
+
+		assert len(list(tmp_path.glob('*.pickle'))) == 2
+
+	def test_disk_cache_write_failure(self, tmp_path):
+		"""Test that a failed cache write returns the workbook and leaves no files."""
+		client = GSParseClient(cache_dir=tmp_path)
+		spreadsheet = Spreadsheet('Test', [Worksheet('Sheet1', [['A', 1]], 1, 2)])
+
+		with (
+			patch.object(
+				client.xlsx_parser, 'parse_workbook', return_value=spreadsheet
+			),
+			patch(
+				'src.gsparse.client.pickle.dump',
+				side_effect=pickle.PicklingError('cannot pickle'),
+			),
+		):
+			assert client._parse_workbook(b'v1') is spreadsheet
+
+		assert list(tmp_path.iterdir()) == []
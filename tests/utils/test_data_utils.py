@@ -26,6 +26,11 @@ class TestDataUtils:
 		result = DataUtils.clean_value('test\r\nvalue\r')
 		assert result == 'test\nvalue'
 
+	def test_clean_value_keeps_blank_lines(self):
+		"""Test line break normalization keeps empty lines inside values."""
+		assert DataUtils.clean_value('a\r\n\r\nb\rc') == 'a\n\nb\nc'
+		assert DataUtils.clean_value('a\n\nb') == 'a\n\nb'
+
 	def test_clean_value_number(self):
 		"""Test cleaning number value."""
 		result = DataUtils.clean_value(42)
@@ -78,6 +83,11 @@ class TestDataUtils:
 		result = DataUtils._decode_unicode_escapes('test\\uZZZZ')
 		assert result == 'test\\uZZZZ'
 
+	def test_decode_unicode_escapes_out_of_range(self):
+		"""Test escapes beyond the Unicode range are left unchanged."""
+		result = DataUtils._decode_unicode_escapes('a\\U0001F600b\\UFFFFFFFF')
+		assert result == 'a\U0001f600b\\UFFFFFFFF'
+
 	def test_decode_unicode_escapes_no_escapes(self):
 		"""Test decoding string without Unicode escapes."""
 		result = DataUtils._decode_unicode_escapes('test')
@@ -244,6 +254,26 @@ class TestDataUtils:
 		result = DataUtils.detect_data_type(column_data)
 		assert result == 'number'
 
+	def test_detect_data_type_matches_converters(self):
+		"""Test each value is classified like the individual converters do."""
+		values = [
+			' 42 ', '+7', '.5', '1e3', '1_000', 'inf', 'nan', '', '  ', 'Yes',
+			'no', ' TRUE ', '2023-01-01', '1.1.2023', '12/31/2023', 'hello',
+			3.5, 0, True, object(),
+		]  # fmt: skip
+
+		for value in values:
+			if DataUtils.convert_to_number(value) is not None:
+				expected = 'number'
+			elif DataUtils.convert_to_boolean(value) is not None:
+				expected = 'boolean'
+			elif DataUtils._is_date_like(value):
+				expected = 'date'
+			else:
+				expected = 'text'
+
+			assert DataUtils.detect_data_type([value]) == expected, value
+
 	def test_is_date_like_valid_dates(self):
 		"""Test checking valid date-like strings."""
 		valid_dates = [
@@ -313,6 +343,12 @@ class TestDataUtils:
 		result = DataUtils.find_empty_rows(data)
 		assert result == []
 
+	def test_find_empty_rows_mixed_types(self):
+		"""Test only None and whitespace-only strings count as blank."""
+		data = [[None, ' \t'], [0, None], [], [False], ['', '\n']]
+		assert DataUtils.find_empty_rows(data) == [0, 2, 4]
+		assert DataUtils.remove_empty_rows(data) == [[0, None], [False]]
+
 	def test_find_empty_columns_no_empty(self):
 		"""Test finding empty columns when there are none."""
 		data = [['A', 'B', 'C'], ['1', '2', '3'], ['X', 'Y', 'Z']]
@@ -331,6 +367,12 @@ class TestDataUtils:
 		result = DataUtils.find_empty_columns(data)
 		assert result == [1, 3]
 
+	def test_find_empty_columns_ragged_rows(self):
+		"""Test missing cells of short rows count as empty."""
+		data = [['A', None, ' '], ['1'], [None, 0, None, 'x']]
+		result = DataUtils.find_empty_columns(data)
+		assert result == [2]
+
 	def test_find_empty_columns_empty_data(self):
 		"""Test finding empty columns in empty data."""
 		data = []
@@ -363,6 +405,13 @@ class TestDataUtils:
 		expected = [['A', 'C'], ['1', '3'], ['X', 'Z']]
 		assert result == expected
 
+	def test_remove_empty_columns_ragged_rows(self):
+		"""Test short rows keep only their own non-empty columns."""
+		data = [['A', '', 'C', 'D'], ['1', None], ['X', '', 'Z']]
+		result = DataUtils.remove_empty_columns(data)
+		assert result == [['A', 'C', 'D'], ['1'], ['X', 'Z']]
+		assert result[1] is not data[1]
+
 	def test_remove_empty_columns_empty_data(self):
 		"""Test removing empty columns from empty data."""
 		data = []
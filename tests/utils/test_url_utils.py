@@ -63,6 +63,12 @@ class TestURLUtils:
 		gid = URLUtils.extract_gid(url)
 		assert gid == '789012'
 
+	def test_extract_gid_percent_encoded(self):
+		"""Test extracting a percent-encoded GID."""
+		url = 'https://docs.google.com/spreadsheets/d/1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms/edit?gid=12%2034&x=1'
+		assert URLUtils.extract_gid(url) == '12 34'
+		assert URLUtils.extract_gid(url.replace('?gid=', '#gid=')) == '12 34'
+
 	def test_extract_gid_no_gid(self):
 		"""Test extracting GID from URL without gid parameter."""
 		url = 'https://docs.google.com/spreadsheets/d/1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms/edit'
@@ -101,6 +107,44 @@ class TestURLUtils:
 		url = ''
 		assert URLUtils.is_google_sheets_url(url) is False
 
+	def test_is_google_sheets_url_host_must_match(self):
+		"""Test the host is checked, not just the presence of a Google domain."""
+		path = '/spreadsheets/d/abc123/edit'
+		assert URLUtils.is_google_sheets_url(f'https://example.com{path}') is False
+		assert (
+			URLUtils.is_google_sheets_url(
+				f'https://example.com{path}?next=https://docs.google.com'
+			)
+			is False
+		)
+		assert URLUtils.is_google_sheets_url(f'https://drive.google.com{path}') is True
+
+	def test_is_google_sheets_url_memoized(self):
+		"""Test repeated validation of the same URL hits the cache."""
+		url = 'https://docs.google.com/spreadsheets/d/memoized123/edit'
+		URLUtils.is_google_sheets_url.cache_clear()
+
+		assert URLUtils.is_google_sheets_url(url) is True
+		assert URLUtils.is_google_sheets_url(url) is True
+
+		info = URLUtils.is_google_sheets_url.cache_info()
+		assert info.hits == 1
+		assert info.misses == 1
+
+	def test_extractors_memoized(self):
+		"""Test sheet ID and GID extraction results are cached per URL."""
+		url = 'https://docs.google.com/spreadsheets/d/memoized456/edit#gid=7'
+		URLUtils.extract_sheet_id.cache_clear()
+		URLUtils.extract_gid.cache_clear()
+
+		assert URLUtils.normalize_url(url).endswith('/memoized456/edit')
+		assert URLUtils.get_public_url(url).endswith('/memoized456/edit#gid=0')
+		assert URLUtils.extract_gid(url) == URLUtils.extract_gid(url) == '7'
+
+		assert URLUtils.extract_sheet_id.cache_info().misses == 1
+		assert URLUtils.extract_sheet_id.cache_info().hits == 1
+		assert URLUtils.extract_gid.cache_info().hits == 1
+
 	def test_normalize_url_valid(self):
 		"""Test normalizing valid Google Sheets URL."""
 		url = 'https://docs.google.com/spreadsheets/d/1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms/edit#gid=0'
@@ -167,6 +211,13 @@ class TestURLUtils:
 		gid = URLUtils.extract_gid(url)
 		assert gid == '123456'
 
+	def test_extract_gid_query_before_fragment(self):
+		"""Test the query gid wins and empty gid values are skipped."""
+		base = 'https://docs.google.com/spreadsheets/d/abc/edit'
+		assert URLUtils.extract_gid(f'{base}?gid=1#gid=2') == '1'
+		assert URLUtils.extract_gid(f'{base}?gid=&x=1#gid=2') == '2'
+		assert URLUtils.extract_gid(f'{base}?grid=1') is None
+
 	def test_extract_gid_hash_fragment(self):
 		"""Test extracting GID from URL with hash fragment."""
 		url = 'https://docs.google.com/spreadsheets/d/1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms/edit#gid=789012'